@@ -0,0 +1,103 @@
+"""add unique constraint on words lemma and language
+
+Before this revision, duplicates were only prevented by a check-then-insert
+in the application, which concurrent requests could race past, so existing
+databases may hold several words with the same (lemma, language_id). The
+upgrade merges them before adding the constraint:
+
+- each group of duplicates is merged onto its lowest word id;
+- dictionary entries are repointed to that word; where a learning profile
+  then has two entries for it, translations, definitions, examples, texts
+  and text chunks move to the lowest dictionary id and the others are deleted;
+- user_word_progress rows are repointed, keeping the lowest id per
+  (learning profile, word);
+- the duplicate words are deleted.
+
+The merge is not undone on downgrade.
+
+Revision ID: add_unique_word_lemma_language
+Revises: add_pos_enum_to_words
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_unique_word_lemma_language'
+down_revision: Union[str, Sequence[str], None] = 'add_pos_enum_to_words'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Merge duplicate words, then add unique (lemma, language_id) constraint on words."""
+
+    # Duplicate word id -> lowest id of its (lemma, language_id) group
+    op.execute("""
+        CREATE TEMP TABLE word_merge ON COMMIT DROP AS
+        SELECT old_id, new_id FROM (
+            SELECT id AS old_id,
+                   MIN(id) OVER (PARTITION BY lemma, language_id) AS new_id
+            FROM words
+        ) grouped
+        WHERE old_id <> new_id
+    """)
+
+    # Dictionary entries that would become duplicates for a learning profile
+    op.execute("""
+        CREATE TEMP TABLE dictionary_merge ON COMMIT DROP AS
+        SELECT old_id, new_id FROM (
+            SELECT d.id AS old_id,
+                   MIN(d.id) OVER (
+                       PARTITION BY d.learning_profile_id, COALESCE(wm.new_id, d.word_id)
+                   ) AS new_id
+            FROM dictionaries d
+            LEFT JOIN word_merge wm ON wm.old_id = d.word_id
+        ) grouped
+        WHERE old_id <> new_id
+    """)
+    for table in ('translations', 'definitions', 'examples', 'texts', 'text_chunks'):
+        op.execute(f"""
+            UPDATE {table} t SET dictionary_id = dm.new_id
+            FROM dictionary_merge dm
+            WHERE t.dictionary_id = dm.old_id
+        """)
+    op.execute("DELETE FROM dictionaries d USING dictionary_merge dm WHERE d.id = dm.old_id")
+    op.execute("""
+        UPDATE dictionaries d SET word_id = wm.new_id
+        FROM word_merge wm
+        WHERE d.word_id = wm.old_id
+    """)
+
+    # Progress rows: keep the lowest id per (learning profile, merged word)
+    op.execute("""
+        DELETE FROM user_word_progress p USING (
+            SELECT p.id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY p.learning_profile_id, COALESCE(wm.new_id, p.word_id)
+                       ORDER BY p.id
+                   ) AS row_number
+            FROM user_word_progress p
+            LEFT JOIN word_merge wm ON wm.old_id = p.word_id
+        ) ranked
+        WHERE p.id = ranked.id AND ranked.row_number > 1
+          AND p.learning_profile_id IS NOT NULL
+    """)
+    op.execute("""
+        UPDATE user_word_progress p SET word_id = wm.new_id
+        FROM word_merge wm
+        WHERE p.word_id = wm.old_id
+    """)
+
+    op.execute("DELETE FROM words w USING word_merge wm WHERE w.id = wm.old_id")
+
+    # Required as the conflict target for INSERT ... ON CONFLICT bulk upserts
+    op.create_unique_constraint('uq_word_lemma_language', 'words', ['lemma', 'language_id'])
+
+
+def downgrade() -> None:
+    """Remove unique (lemma, language_id) constraint on words."""
+    op.drop_constraint('uq_word_lemma_language', 'words', type_='unique')
@@ -10,19 +10,19 @@ This script demonstrates how to:
 """
 
 import asyncio
-import json
+import orjson
 from datetime import datetime
-
-# Import the agent architecture
-from app.agent_architecture import (
-    ContinuousLearningAgent,
-    AgentWorkflowManager,
-    AgentUpdate,
-    UpdateType
-)
+from itertools import islice
 
 async def main():
     """Main example function."""
+    # Imported here so the API listing below doesn't pay for the agent graph
+    from app.agent_architecture import (
+        ContinuousLearningAgent,
+        AgentWorkflowManager,
+        AgentUpdate,
+        UpdateType
+    )
     
     print("🚀 Starting Continuous Learning Agent Example")
     print("=" * 50)
@@ -173,7 +173,9 @@ async def main():
     
     # 12. Show update history
     print("\n12. Recent update history:")
-    recent_updates = agent.agent_state.update_history[-5:]  # Last 5 updates
+    # update_history may be a bounded deque, which doesn't support slicing
+    history = agent.agent_state.update_history
+    recent_updates = islice(history, max(0, len(history) - 5), None)  # Last 5 updates
     for i, update in enumerate(recent_updates, 1):
         print(f"   {i}. {update.update_type.value} - {update.timestamp.strftime('%H:%M:%S')}")
     
@@ -243,13 +245,18 @@ def demonstrate_api_usage():
         print(f"\n{operation}:")
         print(f"  {details['method']} {details['endpoint']}")
         if 'body' in details:
-            print(f"  Body: {json.dumps(details['body'], indent=4)}")
+            print(f"  Body: {orjson.dumps(details['body'], option=orjson.OPT_INDENT_2).decode()}")
         if 'params' in details:
             print(f"  Params: {details['params']}")
 
 if __name__ == "__main__":
-    # Run the async example
-    asyncio.run(main())
+    # Run the async example on one loop that further scenarios can reuse,
+    # instead of an asyncio.run() (new loop and executor) per scenario
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
     
     # Show API usage examples
     demonstrate_api_usage()
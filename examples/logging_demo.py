@@ -6,6 +6,7 @@ This script demonstrates how logging works in Python applications.
 It shows different log levels, structured logging, and error handling.
 """
 
+import logging
 import sys
 import os
 from pathlib import Path
@@ -13,11 +14,10 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.core.logging_config import setup_logging, get_logger
-from src.config.settings import settings
-
 def demonstrate_logging():
     """Demonstrate various logging features."""
+    # Imported lazily: the level/best-practice listings don't need the app config
+    from src.core.logging_config import setup_logging, get_logger, LogCtx
     
     # Setup logging
     setup_logging(
@@ -52,10 +52,7 @@ def demonstrate_logging():
     })
     
     user_logger.info("User performed action", extra={
-        "user_id": 123,
-        "action": "create_word",
-        "word": "hello",
-        "language": "English"
+        "ctx": LogCtx(user_id=123, action="create_word", word="hello", language="English")
     })
     print()
     
@@ -119,14 +116,14 @@ def demonstrate_logging():
     print("6. Performance Logging:")
     import time
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     # Simulate some work
     time.sleep(0.1)
-    end_time = time.time()
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
     
     api_logger.info("Operation completed", extra={
         "operation": "word_translation",
-        "execution_time": end_time - start_time,
+        "execution_time_ms": elapsed_ms,
         "words_processed": 5
     })
     print()
@@ -137,20 +134,23 @@ def demonstrate_logging():
     
     if debug_mode:
         main_logger.debug("Debug mode is enabled - showing detailed information")
-        main_logger.debug("Processing word: 'hello'", extra={
-            "word": "hello",
-            "language": "English",
-            "embedding_model": "sentence-transformers"
-        })
+        # Guarded so the extra dict isn't built when DEBUG is disabled
+        if main_logger.isEnabledFor(logging.DEBUG):
+            main_logger.debug("Processing word: 'hello'", extra={
+                "word": "hello",
+                "language": "English",
+                "embedding_model": "sentence-transformers"
+            })
     
     # 8. Log filtering by level
     print("8. Log Level Filtering:")
     # These will only show if log level is DEBUG
     main_logger.debug("This debug message will only appear if log level is DEBUG or lower")
-    main_logger.debug("Another debug message with context", extra={
-        "component": "word_processor",
-        "stage": "embedding_generation"
-    })
+    if main_logger.isEnabledFor(logging.DEBUG):
+        main_logger.debug("Another debug message with context", extra={
+            "component": "word_processor",
+            "stage": "embedding_generation"
+        })
     print()
     
     print("=== Logging Demonstration Complete ===")
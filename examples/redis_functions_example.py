@@ -22,6 +22,9 @@ from src.core.redis_functions import (
     set_expiration,
     get_ttl,
     
+    # Pipelined operations
+    pipeline_exec,
+    
     # Hash operations
     set_hash_data,
     get_hash_data,
@@ -36,7 +39,7 @@ from src.core.redis_functions import (
     add_to_set,
     get_set_data,
     remove_from_set,
-    is_set_member,
+    are_set_members,
     
     # Utility functions
     redis_health_check,
@@ -47,12 +50,10 @@ from src.core.redis_functions import (
 
 
 def print_result(operation: str, result: Dict[str, Any]):
-    """Print operation result in a formatted way."""
-    print(f"\n{'='*50}")
-    print(f"Operation: {operation}")
-    print(f"{'='*50}")
-    for key, value in result.items():
-        print(f"{key}: {value}")
+    """Print operation result in a formatted way, as a single write."""
+    out = [f"\n{'='*50}", f"Operation: {operation}", f"{'='*50}"]
+    out.extend(f"{key}: {value}" for key, value in result.items())
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def demo_basic_operations():
@@ -60,25 +61,15 @@ def demo_basic_operations():
     print("\n🔧 Basic Redis Operations")
     print("=" * 50)
     
-    # Set cache data
-    result = set_cache_data("user:123", {"name": "John Doe", "email": "john@example.com"}, expiration=3600)
-    print_result("Set Cache Data", result)
-    
-    # Get cache data
-    result = get_cache_data("user:123")
-    print_result("Get Cache Data", result)
-    
-    # Check if key exists
-    result = check_cache_exists("user:123", "user:456")
-    print_result("Check Cache Exists", result)
-    
-    # Get TTL
-    result = get_ttl("user:123")
-    print_result("Get TTL", result)
-    
-    # Set expiration
-    result = set_expiration("user:123", 7200)  # 2 hours
-    print_result("Set Expiration", result)
+    # Set, get, check existence, get TTL and extend expiration in one round trip
+    result = pipeline_exec([
+        ("set", ("user:123", {"name": "John Doe", "email": "john@example.com"}, 3600)),
+        ("get", ("user:123",)),
+        ("exists", ("user:123", "user:456")),
+        ("ttl", ("user:123",)),
+        ("expire", ("user:123", 7200)),  # 2 hours
+    ])
+    print_result("Pipelined Set/Get/Exists/TTL/Expire", result)
     
     # Delete cache data
     result = delete_cache_data("user:123")
@@ -165,12 +156,9 @@ def demo_set_operations():
     print_result("Get Set Data", result)
     
     # Check membership
-    result = is_set_member("tags", "python")
+    result = are_set_members("tags", "python", "javascript")
     print_result("Check Set Membership", result)
     
-    result = is_set_member("tags", "javascript")
-    print_result("Check Set Membership (Not Found)", result)
-    
     # Remove from set
     result = remove_from_set("tags", ["docker", "api"])
     print_result("Remove from Set", result)
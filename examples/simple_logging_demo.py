@@ -7,22 +7,187 @@ the full application dependencies.
 """
 
 import logging
+import copy
 import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
+
+import orjson
+
+# Accepted level names; unknown names fall back to INFO instead of resolving
+# arbitrary attributes of the logging module
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Loggers for the demo's components, looked up once
+MAIN_LOG = logging.getLogger(__name__)
+USER_LOG = logging.getLogger("user_actions")
+DB_LOG = logging.getLogger("database")
+API_LOG = logging.getLogger("api")
+
+# Context for the demo's fixed log calls, built once instead of per call
+_EXTRA_LOGIN = MappingProxyType({
+    "user_id": 123,
+    "username": "john_doe",
+    "ip_address": "192.168.1.100"
+})
+_EXTRA_ACTION = MappingProxyType({
+    "user_id": 123,
+    "action": "create_word",
+    "word": "hello",
+    "language": "English"
+})
+_EXTRA_DB_CONNECT = MappingProxyType({
+    "database": "postgresql",
+    "host": "localhost",
+    "port": 5432
+})
+_EXTRA_QUERY = MappingProxyType({
+    "query": "SELECT * FROM words WHERE language_id = 1",
+    "execution_time": 0.045,
+    "rows_returned": 15
+})
+_EXTRA_API_REQUEST = MappingProxyType({
+    "method": "POST",
+    "endpoint": "/translate",
+    "client_ip": "192.168.1.100"
+})
+_EXTRA_API_RESPONSE = MappingProxyType({
+    "method": "POST",
+    "endpoint": "/translate",
+    "status_code": 200,
+    "response_time": 1.234
+})
+_EXTRA_HELLO = MappingProxyType({
+    "word": "hello",
+    "language": "English",
+    "embedding_model": "sentence-transformers"
+})
+
+# Attributes every LogRecord has; anything else on a record came from `extra`
+_RESERVED = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {"message", "asctime"}
+
+
+class OrjsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, keeping the `extra` fields."""
+
+    def format(self, record):
+        data = {
+            "t": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        data.update({k: v for k, v in record.__dict__.items() if k not in _RESERVED})
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        return orjson.dumps(data, default=str).decode()
+
+
+# Renders tracebacks for MessageQueueHandler
+_EXC_FORMATTER = logging.Formatter()
+
+
+class MessageQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that only merges ``args`` into ``msg`` before enqueueing.
+
+    The stock ``prepare`` formats the record and folds the traceback into the
+    message text, so OrjsonFormatter would never see it. Here the traceback
+    is rendered into ``exc_text`` (dropping the live traceback objects) and
+    left for the listener's formatter to put in its own field.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that collects formatted records in a buffer and
+    writes them in one call per ``flush_bytes`` (or on flush/close), instead
+    of a write and flush per record.
+
+    The file size is tracked in memory, so rollover checks don't stat or
+    seek the file for every record.
+    """
+
+    def __init__(self, filename, *args, flush_bytes=64 * 1024, **kwargs):
+        kwargs.setdefault("encoding", "utf-8")
+        super().__init__(filename, *args, **kwargs)
+        self.flush_bytes = flush_bytes
+        self._buf = bytearray()
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def _open(self):
+        return open(self.baseFilename, "ab", buffering=128 * 1024)
+
+    def emit(self, record):
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            if self.maxBytes > 0 and self._size + len(self._buf) + len(data) >= self.maxBytes:
+                self.flush()
+                if self._size:
+                    self.doRollover()
+            self._buf += data
+            if len(self._buf) >= self.flush_bytes:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._buf:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(self._buf)
+                self.stream.flush()
+                self._size += len(self._buf)
+                # A fresh buffer also drops the capacity of an oversized batch
+                self._buf = bytearray()
+        finally:
+            self.release()
+
+    def doRollover(self):
+        super().doRollover()
+        self._size = 0
+
 
 def setup_simple_logging(log_level="INFO", log_file=None):
-    """Setup basic logging configuration."""
+    """
+    Setup basic logging configuration.
+
+    Log calls only put the record on a queue; a QueueListener thread owns the
+    console/file handlers and does the formatting and writes. At shutdown call
+    ``listener.stop()`` on the returned listener, then flush its handlers.
+    """
     
     # Convert string level to logging constant
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    numeric_level = _LEVELS.get(log_level.upper(), logging.INFO) if isinstance(log_level, str) else log_level
     
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Create formatter (structured JSON, including `extra` context)
+    formatter = OrjsonFormatter()
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -39,21 +204,32 @@ def setup_simple_logging(log_level="INFO", log_file=None):
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Create rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BatchedRotatingFileHandler(
             log_file,
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
+            maxBytes=256 * 1024 * 1024,  # 256MB
+            backupCount=3
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
         handlers.append(file_handler)
     
-    # Configure root logger
+    # Thread/process fields aren't in the format, so don't collect them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    # Configure root logger with a queue in front of the real handlers
+    log_queue = queue.SimpleQueue()
+    queue_handler = MessageQueueHandler(log_queue)
     logging.basicConfig(
         level=numeric_level,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True
     )
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
 
 def demonstrate_logging():
     """Demonstrate various logging features."""
@@ -61,68 +237,36 @@ def demonstrate_logging():
     print("=== Python Logging Demonstration ===\n")
     
     # Setup logging
-    setup_simple_logging(log_level="DEBUG", log_file="logs/simple_demo.log")
-    
-    # Get loggers for different components
-    main_logger = logging.getLogger(__name__)
-    user_logger = logging.getLogger("user_actions")
-    db_logger = logging.getLogger("database")
-    api_logger = logging.getLogger("api")
+    listener = setup_simple_logging(log_level="DEBUG", log_file="logs/simple_demo.log")
     
     # 1. Basic logging levels
     print("1. Basic Logging Levels:")
-    main_logger.debug("Debug: Detailed information for debugging")
-    main_logger.info("Info: General information about program execution")
-    main_logger.warning("Warning: Something unexpected happened")
-    main_logger.error("Error: Something went wrong")
-    main_logger.critical("Critical: Program may not be able to continue")
+    MAIN_LOG.debug("Debug: Detailed information for debugging")
+    MAIN_LOG.info("Info: General information about program execution")
+    MAIN_LOG.warning("Warning: Something unexpected happened")
+    MAIN_LOG.error("Error: Something went wrong")
+    MAIN_LOG.critical("Critical: Program may not be able to continue")
     print()
     
     # 2. Structured logging with context
     print("2. Structured Logging:")
-    user_logger.info("User login successful", extra={
-        "user_id": 123,
-        "username": "john_doe",
-        "ip_address": "192.168.1.100"
-    })
+    USER_LOG.info("User login successful", extra=_EXTRA_LOGIN)
     
-    user_logger.info("User performed action", extra={
-        "user_id": 123,
-        "action": "create_word",
-        "word": "hello",
-        "language": "English"
-    })
+    USER_LOG.info("User performed action", extra=_EXTRA_ACTION)
     print()
     
     # 3. Database operations logging
     print("3. Database Operations:")
-    db_logger.info("Database connection established", extra={
-        "database": "postgresql",
-        "host": "localhost",
-        "port": 5432
-    })
+    DB_LOG.info("Database connection established", extra=_EXTRA_DB_CONNECT)
     
-    db_logger.info("Query executed", extra={
-        "query": "SELECT * FROM words WHERE language_id = 1",
-        "execution_time": 0.045,
-        "rows_returned": 15
-    })
+    DB_LOG.info("Query executed", extra=_EXTRA_QUERY)
     print()
     
     # 4. API request logging
     print("4. API Request Logging:")
-    api_logger.info("API request received", extra={
-        "method": "POST",
-        "endpoint": "/translate",
-        "client_ip": "192.168.1.100"
-    })
+    API_LOG.info("API request received", extra=_EXTRA_API_REQUEST)
     
-    api_logger.info("API response sent", extra={
-        "method": "POST",
-        "endpoint": "/translate",
-        "status_code": 200,
-        "response_time": 1.234
-    })
+    API_LOG.info("API response sent", extra=_EXTRA_API_RESPONSE)
     print()
     
     # 5. Error logging with exceptions
@@ -131,36 +275,36 @@ def demonstrate_logging():
         # Simulate an error
         result = 10 / 0
     except ZeroDivisionError as e:
-        main_logger.error("Division by zero error", extra={
+        MAIN_LOG.error("Division by zero error", extra={
             "operation": "division",
             "dividend": 10,
             "divisor": 0
         })
-        main_logger.exception("Exception details:")
+        MAIN_LOG.exception("Exception details:")
     
     try:
         # Simulate a database error
         raise ConnectionError("Database connection failed")
     except ConnectionError as e:
-        db_logger.error("Database connection failed", extra={
+        DB_LOG.error("Database connection failed", extra={
             "database_url": "postgresql://localhost:5432/db",
             "retry_count": 3
         })
-        db_logger.exception("Database error details:")
+        DB_LOG.exception("Database error details:")
     print()
     
     # 6. Performance logging
     print("6. Performance Logging:")
     import time
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     # Simulate some work
     time.sleep(0.1)
-    end_time = time.time()
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
     
-    api_logger.info("Operation completed", extra={
+    API_LOG.info("Operation completed", extra={
         "operation": "word_translation",
-        "execution_time": end_time - start_time,
+        "execution_time_ms": elapsed_ms,
         "words_processed": 5
     })
     print()
@@ -170,87 +314,96 @@ def demonstrate_logging():
     debug_mode = True
     
     if debug_mode:
-        main_logger.debug("Debug mode is enabled - showing detailed information")
-        main_logger.debug("Processing word: 'hello'", extra={
-            "word": "hello",
-            "language": "English",
-            "embedding_model": "sentence-transformers"
-        })
+        MAIN_LOG.debug("Debug mode is enabled - showing detailed information")
+        # Guarded so nothing is built for this call when DEBUG is disabled
+        if MAIN_LOG.isEnabledFor(logging.DEBUG):
+            MAIN_LOG.debug("Processing word: %r", "hello", extra=_EXTRA_HELLO)
+    
+    # Flush queued records before the closing banner
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
     
     print("=== Logging Demonstration Complete ===")
     print("Check the logs/simple_demo.log file to see the logged messages!")
 
+_LEVELS_TABLE = [
+    ("DEBUG", "Detailed information for diagnosing problems"),
+    ("INFO", "General information about program execution"),
+    ("WARNING", "Something unexpected happened, but the program can continue"),
+    ("ERROR", "A more serious problem occurred"),
+    ("CRITICAL", "A critical problem that may prevent the program from running")
+]
+
+_BEST_PRACTICES = [
+    "Use descriptive log messages that explain what happened",
+    "Include relevant context using the 'extra' parameter",
+    "Use appropriate log levels (don't log everything as ERROR)",
+    "Log exceptions with logger.exception() to include stack traces",
+    "Use structured logging for machine-readable logs",
+    "Configure log rotation to prevent log files from growing too large",
+    "Set different log levels for different environments (DEBUG for dev, INFO for prod)",
+    "Don't log sensitive information like passwords or API keys",
+    "Use consistent log formats across your application",
+    "Consider using log aggregation tools for production environments"
+]
+
+# The help texts never change, so each is built once and written in one call
+_LEVELS_TEXT = (
+    "=== Log Levels Explained ===\n\n"
+    + "".join(f"{level:8} - {description}\n" for level, description in _LEVELS_TABLE)
+    + "\nLog levels are hierarchical:\n"
+    "DEBUG < INFO < WARNING < ERROR < CRITICAL\n"
+    "Setting a level will show that level and all levels above it.\n"
+)
+
+_BEST_PRACTICES_TEXT = (
+    "\n=== Logging Best Practices ===\n\n"
+    + "".join(f"{i:2}. {practice}\n" for i, practice in enumerate(_BEST_PRACTICES, 1))
+)
+
+_LOGGER_USAGE_TEXT = """
+=== How to Use Loggers in Your Code ===
+
+1. Import logging and get a logger:
+   import logging
+   logger = logging.getLogger(__name__)
+
+2. Use different log levels:
+   logger.debug('Debug information')
+   logger.info('General information')
+   logger.warning('Warning message')
+   logger.error('Error message')
+   logger.critical('Critical error')
+
+3. Log with context:
+   logger.info('User action', extra={
+       'user_id': 123,
+       'action': 'login',
+       'ip_address': '192.168.1.1'
+   })
+
+4. Log exceptions:
+   try:
+       # Some code that might fail
+       pass
+   except Exception as e:
+       logger.exception('An error occurred')
+
+"""
+
 def show_log_levels():
     """Show what each log level means."""
-    print("=== Log Levels Explained ===\n")
-    
-    levels = [
-        ("DEBUG", "Detailed information for diagnosing problems"),
-        ("INFO", "General information about program execution"),
-        ("WARNING", "Something unexpected happened, but the program can continue"),
-        ("ERROR", "A more serious problem occurred"),
-        ("CRITICAL", "A critical problem that may prevent the program from running")
-    ]
-    
-    for level, description in levels:
-        print(f"{level:8} - {description}")
-    
-    print("\nLog levels are hierarchical:")
-    print("DEBUG < INFO < WARNING < ERROR < CRITICAL")
-    print("Setting a level will show that level and all levels above it.")
+    sys.stdout.write(_LEVELS_TEXT)
 
 def show_logging_best_practices():
     """Show logging best practices."""
-    print("\n=== Logging Best Practices ===\n")
-    
-    practices = [
-        "Use descriptive log messages that explain what happened",
-        "Include relevant context using the 'extra' parameter",
-        "Use appropriate log levels (don't log everything as ERROR)",
-        "Log exceptions with logger.exception() to include stack traces",
-        "Use structured logging for machine-readable logs",
-        "Configure log rotation to prevent log files from growing too large",
-        "Set different log levels for different environments (DEBUG for dev, INFO for prod)",
-        "Don't log sensitive information like passwords or API keys",
-        "Use consistent log formats across your application",
-        "Consider using log aggregation tools for production environments"
-    ]
-    
-    for i, practice in enumerate(practices, 1):
-        print(f"{i:2}. {practice}")
+    sys.stdout.write(_BEST_PRACTICES_TEXT)
 
 def show_logger_usage():
     """Show how to use loggers in your code."""
-    print("\n=== How to Use Loggers in Your Code ===\n")
-    
-    print("1. Import logging and get a logger:")
-    print("   import logging")
-    print("   logger = logging.getLogger(__name__)")
-    print()
-    
-    print("2. Use different log levels:")
-    print("   logger.debug('Debug information')")
-    print("   logger.info('General information')")
-    print("   logger.warning('Warning message')")
-    print("   logger.error('Error message')")
-    print("   logger.critical('Critical error')")
-    print()
-    
-    print("3. Log with context:")
-    print("   logger.info('User action', extra={")
-    print("       'user_id': 123,")
-    print("       'action': 'login',")
-    print("       'ip_address': '192.168.1.1'")
-    print("   })")
-    print()
-    
-    print("4. Log exceptions:")
-    print("   try:")
-    print("       # Some code that might fail")
-    print("       pass")
-    print("   except Exception as e:")
-    print("       logger.exception('An error occurred')")
-    print()
+    sys.stdout.write(_LOGGER_USAGE_TEXT)
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     # Create logs directory if it doesn't exist
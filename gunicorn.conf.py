@@ -0,0 +1,16 @@
+"""
+Gunicorn settings for the production image.
+
+Each worker is a UvicornWorker, which runs the app on uvloop with the
+httptools parser (both come with uvicorn[standard]).
+"""
+
+import multiprocessing
+import os
+
+bind = "0.0.0.0:8000"
+worker_class = "uvicorn.workers.UvicornWorker"
+# One worker per core by default; WORKERS overrides it like in main.py
+workers = int(os.environ.get("WORKERS", multiprocessing.cpu_count()))
+# Pending connections the kernel queues while every worker is busy
+backlog = 4096
@@ -8,12 +8,18 @@ It imports the FastAPI app from the reorganized source structure.
 
 import uvicorn
 from src.api.main import app
+from src.config.settings import settings
 
 if __name__ == "__main__":
+    # The auto-reloader only runs in DEBUG; it can't be combined with workers
+    reload = settings.DEBUG
     uvicorn.run(
         "src.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=1 if reload else settings.WORKERS,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
@@ -8,8 +8,9 @@ to the new 'src' structure.
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple, Union
 
 # Mapping of old imports to new imports
 IMPORT_MAPPINGS = {
@@ -22,6 +23,7 @@ IMPORT_MAPPINGS = {
     'from app.crud import': 'from src.services.crud import',
     'from app.auth import': 'from src.services.auth import',
     'from app.generate import': 'from src.services.generate import',
+    'from app.prompts import': 'from src.services.prompts import',
     'from app import crud': 'from src.services import crud',
     'from app import auth': 'from src.services import auth',
     'from app import generate': 'from src.services import generate',
@@ -32,56 +34,72 @@ IMPORT_MAPPINGS = {
     'from app.redis_dependency import': 'from src.core.redis_dependency import',
     
     # API
-    'from app.prompts import': 'from src.api.prompts import',
     'from app.nodes import': 'from src.api.nodes import',
     
     # Configuration
     'import os': 'from src.config.settings import settings',
 }
 
-def find_python_files(directory: str) -> List[Path]:
-    """Find all Python files in the given directory."""
-    python_files = []
-    for root, dirs, files in os.walk(directory):
-        # Skip certain directories
-        dirs[:] = [d for d in dirs if d not in ['.git', '__pycache__', '.pytest_cache', '.venv']]
-        
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(Path(root) / file)
-    
-    return python_files
+# All mappings as one alternation (longest first), so a file is scanned once
+# instead of once per mapping
+_MAP_RE = re.compile("|".join(
+    re.escape(old_import) for old_import in sorted(IMPORT_MAPPINGS, key=len, reverse=True)
+))
+# Remaining `from app.x` / `import app.x` forms
+_MOD_RE = re.compile(r'(from|import) app\.(\w+)')
+# Byte strings at least one of which appears in any file that needs changes
+# ('import os' is the only mapping without 'app' in it)
+_MARKERS = (b'app', b'import os')
+
+# Directories never searched for Python files
+_SKIP = frozenset({'.git', '__pycache__', '.pytest_cache', '.venv'})
+
+def iter_python_files(directory: str) -> Iterator[str]:
+    """
+    Yield the paths of all Python files under the given directory.
 
-def update_imports_in_file(file_path: Path) -> Tuple[bool, List[str]]:
+    Paths are yielded as the tree is scanned, so rewriting can start before
+    the walk finishes.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP:
+                    yield from iter_python_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
+
+def update_imports_in_file(file_path: Union[str, Path]) -> Tuple[bool, List[str]]:
     """Update import statements in a single file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        # Most files have nothing to migrate; skip decoding and regex work
+        if not any(marker in raw for marker in _MARKERS):
+            return False, []
+        content = raw.decode('utf-8')
+        
+        matched = {}
         
-        original_content = content
-        changes = []
+        def _replace(match):
+            old_import = match.group(0)
+            matched[old_import] = IMPORT_MAPPINGS[old_import]
+            return IMPORT_MAPPINGS[old_import]
         
         # Apply import mappings
-        for old_import, new_import in IMPORT_MAPPINGS.items():
-            if old_import in content:
-                content = content.replace(old_import, new_import)
-                changes.append(f"  {old_import} → {new_import}")
+        content, mapped = _MAP_RE.subn(_replace, content)
+        changes = [f"  {old_import} → {new_import}" for old_import, new_import in matched.items()]
         
         # Update specific import patterns
-        patterns = [
-            (r'from app\.(\w+) import', r'from src.\1 import'),
-            (r'import app\.(\w+)', r'import src.\1'),
-        ]
-        
-        for pattern, replacement in patterns:
-            if re.search(pattern, content):
-                content = re.sub(pattern, replacement, content)
-                changes.append(f"  Updated import pattern: {pattern}")
+        content, patched = _MOD_RE.subn(r'\1 src.\2', content)
+        if patched:
+            changes.append(f"  Updated import pattern: {_MOD_RE.pattern}")
         
         # Write back if changes were made
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        if mapped or patched:
+            with open(file_path, 'wb') as f:
+                f.write(content.encode('utf-8'))
             return True, changes
         
         return False, []
@@ -89,42 +107,47 @@ def update_imports_in_file(file_path: Path) -> Tuple[bool, List[str]]:
     except Exception as e:
         return False, [f"Error processing {file_path}: {e}"]
 
+def _update_file(file_path: str) -> Tuple[str, bool, List[str]]:
+    """update_imports_in_file, tagged with the path for the report."""
+    return (file_path, *update_imports_in_file(file_path))
+
 def main():
     """Main migration function."""
     print("🔄 Starting import migration...")
     print("=" * 50)
     
-    # Find all Python files
-    python_files = find_python_files('.')
-    
-    print(f"Found {len(python_files)} Python files")
+    # Skip files in the old app directory
+    python_files = (
+        file_path for file_path in iter_python_files('.')
+        if os.path.basename(os.path.dirname(file_path)) != 'app'
+    )
     
-    # Process each file
+    files_processed = 0
     updated_files = 0
     total_changes = 0
     
-    for file_path in python_files:
-        # Skip files in the old app directory
-        if 'app/' in str(file_path) and file_path.parent.name == 'app':
-            continue
-            
-        print(f"\nProcessing: {file_path}")
-        
-        updated, changes = update_imports_in_file(file_path)
+    # Each file is independent, so rewrite them in parallel; map yields the
+    # results in file order for the report below
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_update_file, python_files, chunksize=32)
         
-        if updated:
-            updated_files += 1
-            total_changes += len(changes)
-            print(f"✅ Updated {file_path}")
-            for change in changes:
-                print(change)
-        else:
-            print(f"⏭️  No changes needed for {file_path}")
+        for file_path, updated, changes in results:
+            files_processed += 1
+            print(f"\nProcessing: {file_path}")
+            
+            if updated:
+                updated_files += 1
+                total_changes += len(changes)
+                print(f"✅ Updated {file_path}")
+                for change in changes:
+                    print(change)
+            else:
+                print(f"⏭️  No changes needed for {file_path}")
     
     print("\n" + "=" * 50)
     print(f"Migration completed!")
     print(f"📊 Summary:")
-    print(f"  - Files processed: {len(python_files)}")
+    print(f"  - Files processed: {files_processed}")
     print(f"  - Files updated: {updated_files}")
     print(f"  - Total changes: {total_changes}")
     
@@ -3,18 +3,23 @@
 Test script for Redis functionality.
 
 This script demonstrates how to use Redis with your application.
-Run this script to test Redis connection and basic operations.
+Run it from the project root to test Redis connection and basic operations:
+
+    python -m scripts.test_redis
 """
 
 import os
-import sys
-import json
+import orjson
 from datetime import datetime
 
-# Add the app directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
+# Set REDIS_TEST_VERBOSE=1 to print retrieved values in full
+VERBOSE = os.getenv("REDIS_TEST_VERBOSE") == "1"
 
-from app.redis_client import RedisClient, get_redis_client
+def _preview(data) -> str:
+    """Pretty-print data when verbose, otherwise just its size."""
+    if VERBOSE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return f"{len(data)} items"
 
 def test_basic_operations():
     """Test basic Redis operations."""
@@ -22,7 +27,8 @@ def test_basic_operations():
     print("=" * 40)
     
     try:
-        # Get Redis client
+        # Get Redis client (imported here so loading the script stays cheap)
+        from src.core.redis_client import get_redis_client
         redis = get_redis_client()
         print(f"✅ Connected to Redis at: {redis.url}")
         
@@ -40,7 +46,7 @@ def test_basic_operations():
         
         retrieved_data = redis.get("test:basic")
         print(f"   Get operation: {'✅ Success' if retrieved_data == test_data else '❌ Failed'}")
-        print(f"   Retrieved data: {json.dumps(retrieved_data, indent=2)}")
+        print(f"   Retrieved data: {_preview(retrieved_data)}")
         
         # Test 2: Hash operations
         print("\n2. Testing Hash operations...")
@@ -55,7 +61,7 @@ def test_basic_operations():
         print(f"   Hash set: {fields_set} fields set")
         
         retrieved_hash = redis.hgetall("user:12345")
-        print(f"   Hash get all: {json.dumps(retrieved_hash, indent=2)}")
+        print(f"   Hash get all: {_preview(retrieved_hash)}")
         
         # Test 3: List operations
         print("\n3. Testing List operations...")
@@ -65,7 +71,7 @@ def test_basic_operations():
         print(f"   List push: {pushed_count} items pushed")
         
         list_data = redis.lrange("test:list", 0, -1)
-        print(f"   List range: {json.dumps(list_data, indent=2)}")
+        print(f"   List range: {_preview(list_data)}")
         
         # Test 4: Set operations
         print("\n4. Testing Set operations...")
@@ -87,11 +93,13 @@ def test_basic_operations():
         
         # Test 6: Delete operations
         print("\n6. Testing Delete operations...")
-        deleted_count = redis.delete("test:basic", "user:12345", "test:list", "test:set")
+        # UNLINK and the verifying EXISTS go out in one round trip
+        keys = ("test:basic", "user:12345", "test:list", "test:set")
+        pipe = redis.redis.pipeline(transaction=False)
+        pipe.unlink(*keys)
+        pipe.exists(*keys)
+        deleted_count, exists_after = pipe.execute()
         print(f"   Deleted {deleted_count} keys")
-        
-        # Verify deletion
-        exists_after = redis.exists("test:basic", "user:12345", "test:list", "test:set")
         print(f"   Keys exist after deletion: {exists_after}")
         
         print("\n✅ All basic operations completed successfully!")
@@ -108,6 +116,7 @@ def test_cache_scenarios():
     print("=" * 40)
     
     try:
+        from src.core.redis_client import get_redis_client
         redis = get_redis_client()
         
         # Scenario 1: User session cache
@@ -184,37 +193,40 @@ def test_performance():
     print("=" * 40)
     
     try:
+        from src.core.redis_client import get_redis_client
         redis = get_redis_client()
         
         # Bulk set operations
         print("\n1. Bulk Set Operations...")
         import time
         
-        start_time = time.time()
-        for i in range(100):
-            key = f"bulk:test:{i}"
-            value = {"index": i, "data": f"value_{i}", "timestamp": datetime.now().isoformat()}
-            redis.set(key, value, ex=60)
+        # One timestamp for the whole batch, taken outside the timed section
+        timestamp = datetime.now().isoformat()
+        start_ns = time.perf_counter_ns()
+        # One pipelined round trip instead of one per key
+        redis.mset(
+            {
+                f"bulk:test:{i}": {"index": i, "data": f"value_{i}", "timestamp": timestamp}
+                for i in range(100)
+            },
+            ex=60
+        )
         
-        set_time = time.time() - start_time
-        print(f"   Set 100 keys in {set_time:.3f} seconds")
+        set_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        print(f"   Set 100 keys in {set_ms:.3f} ms")
         
         # Bulk get operations
         print("\n2. Bulk Get Operations...")
-        start_time = time.time()
-        retrieved_count = 0
-        for i in range(100):
-            key = f"bulk:test:{i}"
-            value = redis.get(key)
-            if value:
-                retrieved_count += 1
+        start_ns = time.perf_counter_ns()
+        values = redis.mget(*(f"bulk:test:{i}" for i in range(100)))
+        retrieved_count = sum(1 for value in values if value)
         
-        get_time = time.time() - start_time
-        print(f"   Retrieved {retrieved_count}/100 keys in {get_time:.3f} seconds")
+        get_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        print(f"   Retrieved {retrieved_count}/100 keys in {get_ms:.3f} ms")
         
         # Clean up
         keys_to_delete = [f"bulk:test:{i}" for i in range(100)]
-        deleted_count = redis.delete(*keys_to_delete)
+        deleted_count = redis.unlink(*keys_to_delete)
         print(f"   Cleaned up {deleted_count} keys")
         
         print("\n✅ Performance test completed!")
@@ -272,7 +284,7 @@ def main():
     
     # Close Redis connection
     try:
-        from app.redis_client import close_redis_client
+        from src.core.redis_client import close_redis_client
         close_redis_client()
         print("🔌 Redis connection closed.")
     except:
@@ -1,11 +1,18 @@
-from typing import List, Optional, Dict, Tuple, Any, Union, Set, Annotated
+from typing import List, Optional, Dict, Tuple, Any, Union, Set, Annotated, Iterator
+from contextlib import asynccontextmanager
 import json
+import anyio.to_thread
+import orjson
 from fastapi import FastAPI, HTTPException, Query, Body, Depends, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from src.config.languages import SUPPORTED_LANGUAGE_CODES
 from src.services.generate import generate_translation, generate_definition, generate_examples, language_codes, codes_language, llm, embed
 from src.core.database import Base, engine, get_db
 from src.models import *
 from src.services.crud import get_learning_profile
 from src.models.schemas import TranslationRead as SchemaTranslationRead, ExamplesRead as SchemaExamplesRead, DefinitionRead as SchemaDefinitionRead, TranslationResponse, TranslationInput, ExamplesInput, DefinitionInput
+from src.models.schemas import CacheSetInput, CacheHashSetInput, CacheListPushInput, CacheSetAddInput
 from sqlalchemy.orm import Session, selectinload
 from src.models.crud_schemas import (
     WordBase, WordRead, DictionaryBase, DictionaryRead, TranslationBase, TranslationRead, DefinitionBase, DefinitionRead,
@@ -18,10 +25,12 @@ from datetime import timedelta
 from sqlalchemy.exc import IntegrityError
 from src.services import crud
 from src.core.redis_dependency import get_redis
-from src.core.redis_client import RedisClient
+from src.core.redis_client import RedisClient, get_redis_client, close_redis_client
+from redis.exceptions import RedisError
 from src.core.logging_config import setup_logging, get_logger
 from src.config.settings import settings
-from src.api.nodes import graph, State
+from src.api.nodes import graph
+from src.models.schemas import Context, State
 from langgraph.graph import START, END
 
 # Setup logging
@@ -35,8 +44,38 @@ setup_logging(
 # Get logger for this module
 logger = get_logger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Size the threadpool that runs the sync endpoints and own the Redis client.
+
+    Endpoints stay plain `def` because the DB session, Redis client and LLM
+    calls are all blocking; FastAPI runs them in anyio's threadpool, whose
+    default of 40 threads would otherwise cap concurrency below the DB pool.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    logger.info(f"Threadpool size set to {settings.THREADPOOL_SIZE}")
+    # Build the Redis client up front so the get_redis dependency only hands
+    # out the existing instance; if Redis is down the app still starts and
+    # the first cache request retries the connection
+    try:
+        get_redis_client()
+    except RedisError as e:
+        logger.warning(f"Redis unavailable at startup: {e}")
+    yield
+    close_redis_client()
+
+class OrjsonResponse(ORJSONResponse):
+    """ORJSONResponse that also accepts numpy arrays and non-string dict keys."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
 # Initialize FastAPI application with metadata for Swagger documentation
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,
     title="Personal Dictionary API",
     description="A comprehensive API for managing personal dictionaries and language learning",
     version="1.0.0",
@@ -45,6 +84,10 @@ app = FastAPI(
     openapi_url="/openapi.json"
 )
 
+# Compress larger JSON bodies (cache lists, generated examples) for clients
+# that accept gzip; level 4 keeps most of the size win for little CPU
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
+
 logger.info("FastAPI application initialized")
 
 
@@ -129,7 +172,7 @@ def read_user_me(current_user: Annotated[User, Depends(auth.get_current_active_u
         GET /users/me
         Authorization: Bearer <jwt_token>
     """
-    return UserRead.model_validate(current_user)  
+    return crud.to_user_read(current_user)
 
 @app.get("/users/", response_model=UserRead)
 def get_user_info(db: Session = Depends(get_db), 
@@ -326,6 +369,43 @@ def create_word(word: WordBase, db: Session = Depends(get_db)) -> WordRead:
     """
     return crud.create_word(db, word)
 
+@app.post("/create_words", response_model=List[WordRead], status_code=status.HTTP_201_CREATED)
+def create_words(
+    current_user: Annotated[User, Depends(auth.get_current_active_user)],
+    words: List[WordBase] = Body(..., max_length=settings.MAX_BULK_WORDS),
+    db: Session = Depends(get_db),
+) -> List[WordRead]:
+    """
+    Create many words in one request.
+    
+    Meant for bulk imports: the lemmas of each language are embedded in a
+    single model call and inserted with bulk statements, instead of one
+    embedding and one INSERT per word as with repeated /create_word calls.
+    Lemmas that already exist are skipped. Since every new lemma costs
+    embedding compute, the endpoint requires authentication and accepts at
+    most MAX_BULK_WORDS words per request.
+    
+    Args:
+        current_user (User): Current authenticated user (injected by dependency)
+        words (List[WordBase]): Words to create (lemma and language_id)
+        db (Session): Database session dependency
+        
+    Returns:
+        List[WordRead]: Newly created words
+        
+    Raises:
+        HTTPException: 401 if not authenticated, 404 if a language doesn't exist,
+            422 if more than MAX_BULK_WORDS words are sent
+        
+    Example:
+        POST /create_words
+        [
+            {"lemma": "hello", "language_id": 1},
+            {"lemma": "world", "language_id": 1}
+        ]
+    """
+    return crud.create_words(db, words)
+
 # -----------------------------------------------------------------------------
 # Dictionary Management Endpoints
 # -----------------------------------------------------------------------------
@@ -402,6 +482,38 @@ def create_translation(
     """
     return crud.create_translation(db, translation, current_user)
 
+@app.post("/create_translations", response_model=List[TranslationRead], status_code=status.HTTP_201_CREATED)
+def create_translations(
+    translations: List[TranslationBase],
+    current_user: Annotated[User, Depends(auth.get_current_active_user)],
+    db: Session = Depends(get_db),
+) -> List[TranslationRead]:
+    """
+    Create many translations in one request.
+    
+    Same checks as /create_translation, but the rows are written with a
+    single multi-row INSERT and committed once.
+    
+    Args:
+        translations (List[TranslationBase]): Translations to create
+        current_user (User): Current authenticated user (injected by dependency)
+        db (Session): Database session dependency
+        
+    Returns:
+        List[TranslationRead]: Created translations
+        
+    Raises:
+        HTTPException: 404 if a language or dictionary entry is not found, 403 if a dictionary entry doesn't belong to user
+        
+    Example:
+        POST /create_translations
+        [
+            {"translation": "hola", "language_id": 2, "dictionary_id": 10},
+            {"translation": "adiós", "language_id": 2, "dictionary_id": 11}
+        ]
+    """
+    return crud.create_translations(db, translations, current_user)
+
 # -----------------------------------------------------------------------------
 # Text Management Endpoints
 # -----------------------------------------------------------------------------
@@ -531,28 +643,24 @@ def examples(text: ExamplesInput):
 
 @app.post("/cache/set")
 def set_cache_data(
-    key: str = Body(..., embed=True),
-    value: Any = Body(..., embed=True),
-    expiration: Optional[int] = Body(3600, embed=True),  # Default 1 hour
+    body: CacheSetInput,
     redis: RedisClient = Depends(get_redis)
 ):
     """
     Set data in Redis cache.
     
     Args:
-        key: Cache key
-        value: Value to cache
-        expiration: Expiration time in seconds (default: 3600)
+        body: Cache key, value and expiration in seconds (default: 3600)
         redis: Redis client dependency
         
     Returns:
         Dict: Operation result
     """
-    success = redis.set(key, value, ex=expiration)
+    success = redis.set(body.key, body.value, ex=body.expiration)
     return {
         "success": success,
-        "key": key,
-        "expiration": expiration
+        "key": body.key,
+        "expiration": body.expiration
     }
 
 @app.get("/cache/get/{key}")
@@ -614,8 +722,14 @@ def check_cache_exists(
     Returns:
         Dict: Existence check result
     """
-    exists_count = redis.exists(key)
-    ttl = redis.ttl(key) if exists_count > 0 else -2
+    try:
+        with redis.pipeline() as pipe:
+            pipe.exists(key)
+            pipe.ttl(key)
+            exists_count, ttl = pipe.execute()
+    except RedisError as e:
+        logger.error(f"Error checking existence of key {key}: {e}")
+        exists_count, ttl = 0, -2
     
     return {
         "key": key,
@@ -625,28 +739,42 @@ def check_cache_exists(
 
 @app.post("/cache/hash/set")
 def set_hash_data(
-    hash_name: str = Body(..., embed=True),
-    data: Dict[str, Any] = Body(..., embed=True),
+    body: CacheHashSetInput,
     redis: RedisClient = Depends(get_redis)
 ):
     """
     Set hash data in Redis cache.
     
     Args:
-        hash_name: Hash name
-        data: Dictionary of field-value pairs
+        body: Hash name and dictionary of field-value pairs
         redis: Redis client dependency
         
     Returns:
         Dict: Operation result
     """
-    fields_set = redis.hset(hash_name, data)
+    fields_set = redis.hset(body.hash_name, body.data)
     return {
         "success": fields_set > 0,
-        "hash_name": hash_name,
+        "hash_name": body.hash_name,
         "fields_set": fields_set
     }
 
+def _stream_hash(redis: RedisClient, hash_name: str) -> Iterator[bytes]:
+    """
+    Encode a whole hash as JSON one HSCAN page at a time.
+
+    A Redis error mid-stream propagates and aborts the response before the
+    closing bytes, so the client gets invalid JSON rather than a silently
+    truncated hash. The same holds for _stream_list.
+    """
+    yield b'{"hash_name":' + orjson.dumps(hash_name) + b',"data":{'
+    field_count = 0
+    for chunk in redis.hscan_chunks(hash_name):
+        # Splice each page's members into the enclosing object
+        yield (b"," if field_count else b"") + orjson.dumps(chunk)[1:-1]
+        field_count += len(chunk)
+    yield b'},"field_count":' + orjson.dumps(field_count) + b"}"
+
 @app.get("/cache/hash/get/{hash_name}")
 def get_hash_data(
     hash_name: str,
@@ -673,37 +801,39 @@ def get_hash_data(
             "exists": value is not None
         }
     else:
-        data = redis.hgetall(hash_name)
-        return {
-            "hash_name": hash_name,
-            "data": data,
-            "field_count": len(data)
-        }
+        return StreamingResponse(_stream_hash(redis, hash_name), media_type="application/json")
 
 @app.post("/cache/list/push")
 def push_to_list(
-    list_name: str = Body(..., embed=True),
-    values: List[Any] = Body(..., embed=True),
+    body: CacheListPushInput,
     redis: RedisClient = Depends(get_redis)
 ):
     """
     Push values to a Redis list.
     
     Args:
-        list_name: List name
-        values: Values to push
+        body: List name and values to push
         redis: Redis client dependency
         
     Returns:
         Dict: Operation result
     """
-    pushed_count = redis.lpush(list_name, *values)
+    pushed_count = redis.lpush(body.list_name, *body.values)
     return {
         "success": pushed_count > 0,
-        "list_name": list_name,
+        "list_name": body.list_name,
         "pushed_count": pushed_count
     }
 
+def _stream_list(redis: RedisClient, list_name: str, start: int, end: int) -> Iterator[bytes]:
+    """Encode a list range as JSON one LRANGE window at a time."""
+    yield b'{"list_name":' + orjson.dumps(list_name) + b',"data":['
+    count = 0
+    for chunk in redis.lrange_chunks(list_name, start, end):
+        yield (b"," if count else b"") + orjson.dumps(chunk)[1:-1]
+        count += len(chunk)
+    yield b'],"count":' + orjson.dumps(count) + b',"range":' + orjson.dumps(f"{start}:{end}") + b"}"
+
 @app.get("/cache/list/get/{list_name}")
 def get_list_data(
     list_name: str,
@@ -723,35 +853,27 @@ def get_list_data(
     Returns:
         Dict: List data
     """
-    data = redis.lrange(list_name, start, end)
-    return {
-        "list_name": list_name,
-        "data": data,
-        "count": len(data),
-        "range": f"{start}:{end}"
-    }
+    return StreamingResponse(_stream_list(redis, list_name, start, end), media_type="application/json")
 
 @app.post("/cache/set/add")
 def add_to_set(
-    set_name: str = Body(..., embed=True),
-    values: List[Any] = Body(..., embed=True),
+    body: CacheSetAddInput,
     redis: RedisClient = Depends(get_redis)
 ):
     """
     Add values to a Redis set.
     
     Args:
-        set_name: Set name
-        values: Values to add
+        body: Set name and values to add
         redis: Redis client dependency
         
     Returns:
         Dict: Operation result
     """
-    added_count = redis.sadd(set_name, *values)
+    added_count = redis.sadd(body.set_name, *body.values)
     return {
         "success": added_count > 0,
-        "set_name": set_name,
+        "set_name": body.set_name,
         "added_count": added_count
     }
 
@@ -770,10 +892,10 @@ def get_set_data(
     Returns:
         Dict: Set data
     """
-    data = redis.smembers(set_name)
+    data = redis.sscan(set_name)
     return {
         "set_name": set_name,
-        "data": list(data),
+        "data": data,
         "count": len(data)
     }
 
@@ -793,14 +915,17 @@ def redis_health_check(redis: RedisClient = Depends(get_redis)):
         test_key = "health_check_test"
         test_value = {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
         
-        redis.set(test_key, test_value, ex=10)  # Expire in 10 seconds
-        retrieved_value = redis.get(test_key)
-        redis.delete(test_key)
+        # One round trip for the write, read back and cleanup
+        with redis.pipeline() as pipe:
+            pipe.set(test_key, orjson.dumps(test_value), ex=10)  # Expire in 10 seconds
+            pipe.get(test_key)
+            pipe.delete(test_key)
+            _, retrieved_value, _ = pipe.execute()
         
         return {
             "status": "healthy",
             "redis_url": redis.url,
-            "test_passed": retrieved_value == test_value
+            "test_passed": retrieved_value is not None and orjson.loads(retrieved_value) == test_value
         }
     except Exception as e:
         return {
@@ -836,33 +961,41 @@ def process_text_workflow(
     Returns:
         Dict[str, Any]: Processing results
     """
+    for code in (src_language, tgt_language):
+        if code not in SUPPORTED_LANGUAGE_CODES:
+            raise HTTPException(status_code=400, detail=f"Unsupported language code: {code}")
+
     # Get user's learning profile
-    learning_profile = get_learning_profile(db, current_user)
+    learning_profile = get_learning_profile(
+        db, codes_language[src_language], codes_language[tgt_language], current_user
+    )
+    context = Context(**learning_profile.model_dump(), db=db, user=current_user)
     
     # Initialize state
-    initial_state = {
-        'text': text,
-        'src_language': src_language,
-        'tgt_language': tgt_language,
-        'words': set(),
-        'translations': {},
-        'definitions': {},
-        'examples': {},
-        'examples_number': {},
-        'similar_words': {},
-        'saved_to_json': False
-    }
+    initial_state = State(text=text, src_language=src_language, tgt_language=tgt_language)
     
-    # Compile and run the graph
+    # Compile and run the graph; all save nodes share `db`, so the whole
+    # run is committed (or rolled back) as a single transaction
     compiled_graph = graph.compile()
-    result = compiled_graph.invoke(initial_state, config={"configurable": {"context": learning_profile}})
+    try:
+        result = compiled_graph.invoke(initial_state, config={"configurable": {"context": context}})
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     
+    entries = result.get('entries', {})
     return {
         "status": "success",
-        "processed_words": len(result.get('words', set())),
-        "translations": result.get('translations', {}),
-        "definitions": result.get('definitions', {}),
-        "examples": result.get('examples', {}),
+        "processed_words": len(entries),
+        "translations": {word: entry.translations for word, entry in entries.items()},
+        "definitions": {word: entry.definitions for word, entry in entries.items()},
+        "examples": {word: entry.examples for word, entry in entries.items()},
+        "failed": {
+            "translations": result.get('failed_translations', []),
+            "definitions": result.get('failed_definitions', []),
+            "examples": result.get('failed_examples', []),
+        },
         "saved_to_database": True
     }
 
@@ -1,19 +1,29 @@
-from src.services.generate import generate_translation, generate_definition, generate_examples, codes_language, language_codes
+from src.services.generate import generate_translation, generate_definitions_batch, generate_examples_batch, codes_language, language_codes
 from langgraph.graph import StateGraph, START, END
-from src.models.schemas import State, AllRead, Context
+from src.models.schemas import State, AllRead, Context, WordEntry, ExamplesItem
 from src.models.models import PartOfSpeech
-from src.services.crud import get_learning_profile, get_language_id, get_synonyms, create_word, create_in_dictionary, create_translation, create_definition, create_example, create_text
+from src.services.crud import get_learning_profile, get_synonyms, upsert_words, upsert_dictionary_entries, bulk_create_translations, bulk_create_definitions, bulk_create_examples, create_text
 from src.models.models import Word, Dictionary, LearningProfile
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
-from src.models.crud_schemas import LearningProfileRead, TextRead, WordBase, DictionaryBase, TranslationBase, DictionaryRead, DefinitionBase, ExampleBase, DefinitionRead, ExampleRead, TranslationRead
+from sqlalchemy.exc import IntegrityError
+from src.models.crud_schemas import LearningProfileRead, TextBase, TextRead, WordBase, DictionaryBase, TranslationBase, DictionaryRead, DefinitionBase, ExampleBase, DefinitionRead, ExampleRead, TranslationRead
 from langchain.tools import tool
 from langgraph.prebuilt import ToolNode
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, pairwise, batched
+from operator import attrgetter
+from functools import lru_cache
+import re
+import sys
+import unicodedata
+from bisect import bisect_right
 import spacy
 import pymorphy2
 from konlpy.tag import Mecab
 from typing import List, Dict, TypedDict, Tuple, Set
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from src.config.settings import settings
 
 _KO_OKT_TO_UPOS = {
     "Noun": "NOUN",
@@ -56,123 +66,245 @@ _RU_TO_UPOS = {
     "INTJ": "INTJ",
 }
 
+# Upper bound on LLM calls in flight for one workflow node
+MAX_CONCURRENT_LLM_CALLS = 8
+
+# Words per translation LLM call; the chunks those words come from are sent
+# together as context, separated by PASSAGE_SEPARATOR
+WORDS_PER_TRANSLATION_CALL = 32
+PASSAGE_SEPARATOR = "\n---\n"
+
+# Words per definitions/examples LLM call; a text's words are split into
+# batches of this size that run concurrently, instead of one long generation
+WORDS_PER_LLM_CALL = 20
+
+# UPOS tag -> enum member, resolved once instead of calling PartOfSpeech(tag)
+# (and catching ValueError) for every extracted word
+_POS_BY_TAG = {member.value: member for member in PartOfSpeech}
+
+
+def canonical_word(word: str) -> str:
+    """
+    Canonical form used to deduplicate words: NFKC-normalized, stripped and lowercased.
+
+    The result is interned: the same word is used as a key in `entries`,
+    `word_ids` and `dictionaries`, and interned keys share one object, so
+    those lookups hit the identity fast path with a cached hash.
+    """
+    return sys.intern(unicodedata.normalize("NFKC", word).strip().lower())
+
+
+# Analyzers are loaded on first use and then shared by every call: loading the
+# spaCy model or pymorphy2's dictionaries takes far longer than analyzing a
+# chunk. A failed load is cached as None so the fallback path doesn't retry it.
+
+@lru_cache(maxsize=1)
+def _get_en_nlp():
+    try:
+        # Only lemmas and POS are read. attribute_ruler stays: it maps tags to
+        # token.pos_, which the rule-based lemmatizer relies on
+        return spacy.load("en_core_web_sm", disable=["parser", "ner", "senter"])
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_morph_ru():
+    try:
+        return pymorphy2.MorphAnalyzer()
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=50000)
+def _parse_ru(token: str) -> Tuple[str, str]:
+    """
+    Most likely (normal form, UPOS tag) of a Russian word.
+
+    Word frequencies are Zipfian, so most tokens of a text repeat and are
+    answered from the cache instead of going through pymorphy2's analysis.
+    """
+    parsed = _get_morph_ru().parse(token)[0]
+    return parsed.normal_form, _RU_TO_UPOS.get(parsed.tag.POS, "X")
+
+
+@lru_cache(maxsize=1)
+def _get_mecab():
+    try:
+        return Mecab()
+    except Exception:
+        return None
+
+
+# Whitespace-separated words with their offsets (what str.split() yields)
+_WORD_RE = re.compile(r"\S+")
+
+# Built once: the splitter keeps no per-call state, and constructing it
+# copies the separator list on every call
+_TEXT_SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=300,
+    chunk_overlap=100,
+    add_start_index=True,
+    separators=["\n\n", "\n", ".", "!", "?", ", ", " ", ""]
+)
+
+
+def _paragraphs(text: str) -> List[Tuple[int, str]]:
+    """Split text on blank lines, keeping each paragraph's start offset."""
+    pieces = []
+    offset = 0
+    for piece in text.split("\n\n"):
+        pieces.append((offset, piece))
+        offset += len(piece) + 2
+    return pieces
+
+
+def _analyze(text: str, lang: str) -> List[Tuple[int, Tuple[str, str, str]]]:
+    """
+    Run the language's analyzer over the whole text once.
+
+    Returns (character offset, ("lemma", "pos", "lang")) for every word kept.
+    """
+    if lang == "en" and (nlp := _get_en_nlp()) is not None:
+        # Paragraphs are streamed through spaCy in batches, which also keeps
+        # each doc under the model's max_length
+        pieces = _paragraphs(text)
+        docs = nlp.pipe([piece for _, piece in pieces], batch_size=settings.SPACY_BATCH_SIZE, n_process=settings.SPACY_N_PROCESS)
+        return [
+            (offset + token.idx, (token.lemma_, token.pos_, lang))
+            for (offset, _), doc in zip(pieces, docs)
+            for token in doc
+            if token.is_alpha
+        ]
+
+    # Russian (better accuracy with pymorphy2)
+    if lang == "ru" and _get_morph_ru() is not None:
+        parse_ru = _parse_ru
+        return [
+            (match.start(), (*parse_ru(token), lang))
+            for match in _WORD_RE.finditer(text)
+            if (token := match.group()).isalpha()
+        ]
+
+    # Korean (Mecab)
+    if lang == "ko":
+        mecab = _get_mecab()
+        if mecab is None:
+            # Fallback
+            return [(match.start(), (match.group(), "X", lang)) for match in _WORD_RE.finditer(text)]
+        words = []
+        add = words.append
+        get_upos = _KO_OKT_TO_UPOS.get
+        find = text.find
+        # Mecab doesn't report offsets; find each morpheme from where the
+        # previous one ended (morphemes it rewrites keep the last offset)
+        cursor = 0
+        for token, pos in mecab.pos(text):
+            found = find(token, cursor)
+            if found != -1:
+                cursor = found + len(token)
+            add((found if found != -1 else cursor, (token, get_upos(pos, "X"), lang)))
+        return words
+
+    # Fallback for unsupported languages or a missing spaCy/pymorphy2 model.
+    # The scan and the per-word checks are C-level (re, str.isalpha/lower);
+    # what's left in Python is one tuple per kept word.
+    return [
+        (match.start(), (token.lower(), "X", lang))
+        for match in _WORD_RE.finditer(text)
+        if (token := match.group()).isalpha()
+    ]
+
+
 def lemmatize_text(text: str, lang: str) -> Dict[str, Set[Tuple[str, str, str]]]:
     """
     Lemmatize text depending on language with context preservation.
     Supports: English, Russian, Korean.
+
+    The analyzer runs over the whole text once; each word is then assigned
+    to every (overlapping) chunk whose span contains its offset, so words in
+    the overlaps aren't analyzed twice.
     
     Returns dict: {chunk_text: {("lemma", "pos", "lang"), ...}}
     """ 
-    results = {}
-
-    # Split text into chunks for context preservation
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=300, 
-        chunk_overlap=100, 
-        add_start_index=True,
-        separators=["\n\n", "\n", ".", "!", "?", ", ", " ", ""]
-    )
-    chunks = text_splitter.split_text(text) # type: ignore  
-    
-    # Process each chunk
-    for chunk in chunks:
-        chunk_words = set()
-        
-        if lang == "en":
-            try:
-                nlp = spacy.load("en_core_web_sm")
-                doc = nlp(chunk)
-                for token in doc:
-                    if token.is_alpha:
-                        chunk_words.add((token.lemma_, token.pos_, lang))
-            except OSError:
-                # Fallback to simple splitting
-                words = chunk.split()
-                for word in words:
-                    if word.isalpha():
-                        chunk_words.add((word.lower(), "X", lang))
-
-        # Russian (better accuracy with pymorphy2)
-        elif lang == "ru":
-            try:
-                morph_ru = pymorphy2.MorphAnalyzer()
-                tokens = chunk.split()  
-                for token in tokens:
-                    if token.isalpha():
-                        parsed = morph_ru.parse(token)[0]
-                        chunk_words.add((parsed.normal_form, _RU_TO_UPOS[parsed.tag.POS], lang))
-            except Exception:
-                # Fallback
-                words = chunk.split()
-                for word in words:
-                    if word.isalpha():
-                        chunk_words.add((word.lower(), "X", lang))
-
-        # Korean (Mecab)
-        elif lang == "ko":
-            try:
-                mecab = Mecab()
-                for token, pos in mecab.pos(chunk):
-                    chunk_words.add((token, _KO_OKT_TO_UPOS[pos], lang))
-            except Exception:
-                # Fallback
-                words = chunk.split()
-                for word in words:
-                    chunk_words.add((word, "X", lang))
-
-        else:
-            # Fallback for unsupported languages
-            words = chunk.split()
-            for word in words:
-                if word.isalpha():
-                    chunk_words.add((word.lower(), "X", lang))
-        
-        # Add chunk with its words
-        if chunk_words:
-            results[chunk] = chunk_words
+    results: Dict[str, Set[Tuple[str, str, str]]] = {}
+
+    # Split text into chunks for context preservation. The splitter reports
+    # start_index -1 when it can't locate a chunk in the text; those are
+    # looked up again after the previous chunk and dropped if still missing,
+    # so starts stay ascending for the bisect below
+    chunks = []
+    prev_start = 0
+    for doc in _TEXT_SPLITTER.create_documents([text]):
+        chunk, start = doc.page_content, doc.metadata["start_index"]
+        if start < 0:
+            start = text.find(chunk, prev_start)
+            if start < 0:
+                continue
+        chunks.append((chunk, start))
+        prev_start = start
+    starts = [start for _, start in chunks]
+    longest = max((len(chunk) for chunk, _ in chunks), default=0)
+
+    for offset, word in _analyze(text, lang):
+        # Chunks are ordered by start; only those starting less than one
+        # chunk length before offset can contain it
+        i = bisect_right(starts, offset) - 1
+        while i >= 0 and starts[i] + longest > offset:
+            chunk, start = chunks[i]
+            if offset < start + len(chunk):
+                results.setdefault(chunk, set()).add(word)
+            i -= 1
     return results
 
 def extract_saved_words_node(state: State, context: Context) -> dict:
     """
     Extract words from saved text that are not already in user's dictionary.
     Returns words that need to be created with their context chunks.
+
+    Also resolves the source language id and the language display names once
+    per run so later nodes don't each look them up again.
     
-    Returns: {"chunks": {chunk_text: {("lemma", "pos", "lang"), ...}}}
+    Returns: {"chunks": {chunk_text: {("lemma", "pos", "lang"), ...}}, "src_language_id": int,
+              "src_language_name": str, "tgt_language_name": str}
     """
-    chunks = lemmatize_text(state['text'], context.primary_language)
+    chunks = lemmatize_text(state.text, context.primary_language)
     db = context.db
-    words_to_create = {}  
-    
-    # Process each chunk and its words
-    for chunk_text, chunk_words in chunks.items():
-        words_to_create[chunk_text] = set()
-        for lemma, pos, lang in chunk_words:
-            # Convert string POS to enum if needed
-            pos_enum = None
-            if isinstance(pos, str):
-                try:
-                    pos_enum = PartOfSpeech(pos)
-                except ValueError:
-                    pos_enum = None
-            
-            # Check if word exists in user's dictionary
-            word_exists = db.query(
-                db.query(Word.id)
-                .join(Dictionary, Word.id == Dictionary.word_id)
-                .join(LearningProfile, Dictionary.learning_profile_id == LearningProfile.id)
-                .filter(
-                    LearningProfile.id == context.learning_profile_id,
-                    Word.lemma == lemma,  
-                    Word.pos == pos_enum, 
-                )
-                .exists()
-            ).scalar()
-            
-            # If word doesn't exist in dictionary, add it to creation list
-            if not word_exists:
-                words_to_create[chunk_text].add((lemma, pos, lang))
+
+    # Look up every lemma of the text in the user's dictionary with one query
+    # and compare (lemma, pos) pairs here; tags outside the enum map to None,
+    # which compares equal to a NULL pos just like `Word.pos == None` did.
+    # Words are saved in canonical form, so lemmas are compared in it too.
+    canonical = {
+        lemma: canonical_word(lemma)
+        for chunk_words in chunks.values() for lemma, _, _ in chunk_words
+    }
+    existing = set(
+        db.query(Word.lemma, Word.pos)
+        .join(Dictionary, Word.id == Dictionary.word_id)
+        .filter(
+            Dictionary.learning_profile_id == context.learning_profile_id,
+            Word.lemma.in_(set(canonical.values())),
+        )
+        .all()
+    ) if canonical else set()
+
+    # Keep only the words that aren't in the dictionary yet
+    words_to_create = {
+        chunk_text: {
+            (lemma, pos, lang)
+            for lemma, pos, lang in chunk_words
+            if (canonical[lemma], _POS_BY_TAG.get(pos)) not in existing
+        }
+        for chunk_text, chunk_words in chunks.items()
+    }
     
-    return {"chunks": words_to_create}
+    return {
+        "chunks": words_to_create,
+        "src_language_id": context.primary_language_id,
+        "src_language_name": codes_language[state.src_language],
+        "tgt_language_name": codes_language[state.tgt_language],
+    }
 
 def translate_words_node(state: State) -> dict:
     """
@@ -180,205 +312,234 @@ def translate_words_node(state: State) -> dict:
 
     This function:
     1. Processes chunks with words that need translation.
-    2. Calls `generate_translation()` for each chunk with context.
-    3. Tracks already translated words to avoid duplicates.
-    4. Returns updated `words` and `translations` in the state.
+    2. Assigns every word to the first chunk it appears in, tracking already
+       assigned words (in canonical form, see `canonical_word`) so case and
+       Unicode variants are sent to the LLM only once.
+    3. Packs consecutive chunks into calls of about WORDS_PER_TRANSLATION_CALL
+       words, with the chunks (plus the last one's successor) as context.
+    4. Calls `generate_translation()` for all batches concurrently, at most
+       MAX_CONCURRENT_LLM_CALLS at a time, so the node takes about as long
+       as the slowest call instead of the sum of all calls.
+    5. Creates a `WordEntry` with its translations for every translated word.
 
     Args:
-        state (State): Current state containing `chunks`, `src_language`, and `tgt_language`.
+        state (State): Current state containing `chunks`, `src_language_name`, and `tgt_language_name`.
 
     Returns:
         dict: Updated state keys:
-            - 'words': set of unique words found in translation
-            - 'translations': dict with translations
+            - 'entries': dict mapping each translated word to its WordEntry
     """
-    translations = {}
-    chunks = state['chunks']
-    chunk_list = list(chunks.items())  # Convert to list for indexing
+    entries: Dict[str, WordEntry] = {}
+    chunks = state.chunks
+    src_language_name = state.src_language_name
+    tgt_language_name = state.tgt_language_name
     already_translated = set()  # Track words already translated
+    jobs: List[Tuple[str, List[str]]] = []  # (context, words) per LLM call
+    batch_words: List[str] = []
+    batch_passages: List[str] = []
+    successor = None
+
+    def flush():
+        # The last chunk's successor closes the context, as the overlapping
+        # chunk used to for a single-chunk call
+        passages = batch_passages + ([successor] if successor is not None else [])
+        jobs.append((PASSAGE_SEPARATOR.join(passages), list(batch_words)))
+        batch_words.clear()
+        batch_passages.clear()
     
-    for i, (chunk_text, chunk_words) in enumerate(chunk_list):
+    # Walk chunks together with their successor instead of copying them into a list for indexing
+    for chunk_text, next_chunk_text in pairwise(chain(chunks, [None])):
+        chunk_words = chunks[chunk_text]
         # Extract just the lemmas for translation, excluding already translated ones
         words_to_translate = []
         for lemma, pos, lang in chunk_words:
-            if lemma not in already_translated:
-                words_to_translate.append(lemma)
-                already_translated.add(lemma)
+            word = canonical_word(lemma)
+            if word and word not in already_translated:
+                words_to_translate.append(word)
+                already_translated.add(word)
         
         # Skip if no new words to translate
         if not words_to_translate:
             continue
         
-        # Create context: current chunk + next overlapping chunk
-        context = chunk_text
-        if i + 1 < len(chunk_list):
-            next_chunk_text = chunk_list[i + 1][0]
-            context = f"{chunk_text} {next_chunk_text}"
-
-        # Call generate_translation for this chunk
-        chunk_translation = generate_translation(
+        # Chunks with new words are packed into one call until it carries
+        # WORDS_PER_TRANSLATION_CALL words, instead of one call per chunk
+        batch_words.extend(words_to_translate)
+        batch_passages.append(chunk_text)
+        successor = next_chunk_text
+        if len(batch_words) >= WORDS_PER_TRANSLATION_CALL:
+            flush()
+    if batch_words:
+        flush()
+
+    def translate_chunk(job: Tuple[str, List[str]]):
+        context, words = job
+        return generate_translation(
             context=context,
-            words=words_to_translate,
-            src_language=codes_language[state['src_language']],  
-            tgt_language=codes_language[state['tgt_language']]
+            words=words,
+            src_language=src_language_name,  
+            tgt_language=tgt_language_name
         )
-        translations.update(chunk_translation)
-        
-    words = set(translations.keys())
 
-    return {
-        'words': words,
-        'translations': translations
-    }
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LLM_CALLS) as pool:
+        # map() yields results in chunk order, so merging stays deterministic
+        for chunk_translation in pool.map(translate_chunk, jobs):
+            # The LLM may echo words back in another case or form; merge such variants
+            for word, translations in chunk_translation.words.items():
+                entry = entries.setdefault(canonical_word(word), WordEntry())
+                entry.translations.extend(t for t in translations if t not in entry.translations)
+
+    return {'entries': entries}
+
+def _map_llm_batches(generate, items: list) -> Dict[str, List[str]]:
+    """
+    Call `generate` on batches of WORDS_PER_LLM_CALL items, concurrently,
+    and merge the word -> list results.
+    """
+    batches = [list(batch) for batch in batched(items, WORDS_PER_LLM_CALL)]
+    if len(batches) <= 1:
+        return generate(batches[0]) if batches else {}
+    merged: Dict[str, List[str]] = {}
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LLM_CALLS) as pool:
+        for result in pool.map(generate, batches):
+            merged.update(result)
+    return merged
 
 def generate_definitions_node(state: State) -> dict:
     """
     Node: Generate definitions for translated words.
 
     This function:
-    1. Iterates over existing words in `definitions`.
-    2. Calls `generate_definitions()` for each word.
-    3. Extends the definitions list if new ones are found.
+    1. Collects every word in `entries`.
+    2. Calls `generate_definitions_batch()` for batches of WORDS_PER_LLM_CALL
+       words, at most MAX_CONCURRENT_LLM_CALLS at a time.
+    3. Extends the definitions list of each word's entry with the new ones.
 
     Args:
-        state (State): Current state containing `definitions` and `src_language`.
+        state (State): Current state containing `entries` and `src_language_name`.
 
     Returns:
-        dict: Updated 'definitions' key in state.
+        dict: Updated 'entries' key in state.
     """
-    definitions = state['definitions']
+    entries = state.entries
+    language = state.src_language_name
 
-    for word in list(definitions.keys()):  # Copy keys to avoid runtime mutation issues
-        def_dict = generate_definition(
-            word,
-            codes_language[state['src_language']]
-        )
+    def_dict = _map_llm_batches(
+        lambda words: generate_definitions_batch(words, language),
+        list(entries)
+    )
 
-        # Append new definitions if they exist
-        if def_dict.get('definition'):
-            definitions[word].extend(def_dict['definition'])
+    # Append new definitions for the requested words only
+    for word, entry in entries.items():
+        if def_dict.get(word):
+            entry.definitions.extend(def_dict[word])
 
-    return {'definitions': definitions}
+    return {'entries': entries}
 
 def generate_examples_node(state: State) -> dict:
     """
     Node: Generate example sentences for each word.
 
     This function:
-    1. Uses `examples_number` to determine how many examples per word.
-    2. Calls `generate_examples()` for each word.
-    3. Extends the examples list if new ones are found.
+    1. Uses each entry's `examples_number` to determine how many examples per word.
+    2. Calls `generate_examples_batch()` for batches of WORDS_PER_LLM_CALL
+       words, at most MAX_CONCURRENT_LLM_CALLS at a time.
+    3. Extends the examples list of each word's entry with the new ones.
 
     Args:
-        state (State): Current state containing `examples`, `examples_number`, `definitions`.
+        state (State): Current state containing `entries` and `src_language_name`.
 
     Returns:
-        dict: Updated 'examples' key in state.
+        dict: Updated 'entries' key in state.
     """
-    examples = state['examples']
-
-    for word in examples.keys():
-
-        ex_number = 1
-
+    entries = state.entries
 
-        if state['examples_number'].get(word):
-            ex_number = state['examples_number'][word]
+    items = [
+        ExamplesItem(word, entry.examples_number or 1, "; ".join(entry.definitions) or None)
+        for word, entry in entries.items()
+    ]
+    language = state.src_language_name
+    ex_dict = _map_llm_batches(lambda batch: generate_examples_batch(batch, language), items)
 
-        ex_dict = generate_examples(
-            word,
-            codes_language[state['src_language']],
-            state['definitions'][word],
-            ex_number
-        )
-
-        # Append examples if found
-        if ex_dict.get('examples'):
-            examples[word].extend(ex_dict['examples'])
+    # Append examples for the requested words only
+    for word, entry in entries.items():
+        if ex_dict.get(word):
+            entry.examples.extend(ex_dict[word])
 
-    return {
-        'examples': examples
-    }
+    return {'entries': entries}
 
-def get_synonyms_node(state: State) -> dict:
+def get_synonyms_node(state: State, context: Context) -> dict:
     """
     Node: Get synonyms for each word.
 
     This function:
-    1. Iterates over existing words in `synonyms`.
-    2. Calls `get_synonyms()` for each word.
-    3. Extends the synonyms list if new ones are found.
+    1. Iterates over every word in `entries`.
+    2. Calls `get_synonyms()` for each word, scoped to the learning profile's
+       dictionary in the source language, through the run's session.
+    3. Stores the similar lemmas on the word's entry.
 
 
     Args:
-        state (State): Current state containing `synonyms` and `src_language`.
+        state (State): Current state containing `entries` and `src_language_id`.
+        context (Context): Context containing the database session and learning profile.
 
     Returns:
-        dict: Updated 'synonyms' key in state.
+        dict: Updated 'entries' key in state.
     """
-    synonyms = state['synonyms']    
-
-    for word in synonyms.keys():
-        synonyms[word] = get_synonyms(
-            word,
-            codes_language[state['src_language']]
-        )
+    entries = state.entries
+
+    for word, entry in entries.items():
+        entry.synonyms = [
+            synonym.lemma
+            for synonym in get_synonyms(
+                context.db,
+                word,
+                context.learning_profile_id,
+                state.src_language_id
+            )
+        ]
 
-    return {'synonyms': synonyms}
+    return {'entries': entries}
 
 @tool
 def save_text_node(state: State, context: Context) -> dict:
     """
     Node: Save the input text to the database.
-    """
 
+    The id of the created text is kept in state as `text_id` so later steps
+    (and the workflow `Output`) don't have to query for it. The node runs in
+    parallel with the LLM generation branch and is the only one touching
+    the session during that step. Errors are not
+    swallowed: a failed insert aborts the run instead of silently producing
+    an output without its text.
+    """
     
     db = context.db
 
-    src_language_id = context.primary_language_id
-    tgt_language_id = context.foreign_language_id
-    learning_profile_id = context.learning_profile_id
-    try:
-        text: TextRead = create_text(db, state['text'], learning_profile_id, src_language_id, tgt_language_id)
-        return state
-    except Exception as e:
-        return state
+    text = TextBase(learning_profile_id=context.learning_profile_id, text=state.text)
+    text_db: TextRead = create_text(db, text, context.learning_profile_id, commit=False)
+    return {'text_id': text_db.id}
 
 @tool
 def save_words_node(state: State, context: Context) -> dict:
     """
     Node: Save words to the database.
+
+    All words are written with one bulk upsert instead of a `create_word`
+    call (plus a re-SELECT on 409) per word.
     """
     
     db = context.db
 
-    src_language_id = get_language_id(language_name=context.primary_language)
-    created_words = []
-    existing_words = []
-    word_db_map = {}  # Map words to their database objects
-    
-    for word in state['words']:
-        try:
-            current_word = WordBase(lemma=word, language_id=src_language_id)
-            word_db = create_word(db, current_word)
-            created_words.append(word)
-            word_db_map[word] = word_db
-        except HTTPException as e:
-            if e.status_code == 409:  # Word already exists
-                word_db = db.query(Word).filter(
-                    Word.lemma == word,
-                    Word.language_id == src_language_id
-                ).first()
-                existing_words.append(word)
-                word_db_map[word] = word_db
-            else:
-                print(f"Error creating word '{word}': {e}")
-                continue
+    src_language_id = state.src_language_id
+    word_ids, created_words = upsert_words(db, state.entries, src_language_id)
+    created = set(created_words)
+    existing_words = [word for word in word_ids if word not in created]
     
     return {
         'created_words': created_words,
         'existing_words': existing_words,
-        'word_db_map': word_db_map
+        'word_ids': word_ids
     }
     
 
@@ -386,67 +547,92 @@ def save_words_node(state: State, context: Context) -> dict:
 def save_dictionary_node(state: State, context: Context) -> dict:
     """
     Node: Save dictionary entries to the database.
+
+    New and existing entries both come back from a single upsert with
+    RETURNING, so no per-word 409 handling or re-SELECT is needed.
     """
     
     db = context.db
 
-    learning_profile_id = context.learning_profile_id
-    word_db_map = state.get('word_db_map', {})
-    created_dictionary_entries = []
-    existing_dictionary_entries = []
-    dictionary_db_map = {}  # Map words to their dictionary objects
-    
-    for word, word_db in word_db_map.items():
-        try:
-            dictionary = DictionaryBase(learning_profile_id=learning_profile_id, word_id=word_db.id)
-            dictionary_db = create_in_dictionary(db, dictionary, context.user)
-            created_dictionary_entries.append(word)
-            dictionary_db_map[word] = dictionary_db
-        except HTTPException as e:
-            if e.status_code == 409:  # Dictionary entry already exists
-                dictionary_db = db.query(Dictionary).filter(
-                    Dictionary.learning_profile_id == learning_profile_id,
-                    Dictionary.word_id == word_db.id
-                ).first()
-                existing_dictionary_entries.append(word)
-                dictionary_db_map[word] = dictionary_db
-            else:
-                print(f"Error creating dictionary entry for word '{word}': {e}")
-                continue
+    dictionaries, created_dictionary_entries = upsert_dictionary_entries(
+        db, context.learning_profile_id, state.word_ids
+    )
+    created = set(created_dictionary_entries)
+    existing_dictionary_entries = [word for word in dictionaries if word not in created]
     
     return {
         'created_dictionary_entries': created_dictionary_entries,
         'existing_dictionary_entries': existing_dictionary_entries,
-        'dictionary_db_map': dictionary_db_map
+        'dictionaries': dictionaries
     }
 
 
+def _bulk_save(
+    db: Session,
+    bulk_create,
+    state: State,
+    field: str,
+    column: str,
+    language_id: int,
+    missing_reason: str
+) -> Tuple[List[str], List[Dict[str, str]]]:
+    """
+    Write one WordEntry field of every saved word with one bulk insert inside a SAVEPOINT.
+
+    Rows are built in a single pass over `dictionaries`; the entry field is
+    read through a prebuilt `attrgetter` and everything that is constant per
+    run (language id, column name) is bound once outside the loop.
+
+    Words without rows and, when the insert violates a constraint, every word
+    of the batch are reported as failures with a reason instead of being
+    dropped silently. The SAVEPOINT keeps the rest of the run's transaction
+    usable after such a failure. Any other error propagates and aborts the run.
+
+    Returns:
+        Tuple[List[str], List[Dict[str, str]]]: Saved words, and
+        {"word": ..., "reason": ...} records for the failed ones
+    """
+    get_items = attrgetter(field)
+    entries = state.entries
+    rows: List[dict] = []
+    saved: List[str] = []
+    failed: List[Dict[str, str]] = []
+    for word, dictionary_id in state.dictionaries.items():
+        items = get_items(entries[word])
+        if not items:
+            failed.append({"word": word, "reason": missing_reason})
+            continue
+        saved.append(word)
+        rows.extend(
+            {"dictionary_id": dictionary_id, "language_id": language_id, column: item}
+            for item in items
+        )
+
+    try:
+        with db.begin_nested():
+            bulk_create(db, rows)
+    except IntegrityError as e:
+        failed.extend({"word": word, "reason": str(e.orig)} for word in saved)
+        saved = []
+    return saved, failed
+
+
 @tool
 def save_translation_node(state: State, context: Context) -> dict:
     """
     Node: Save translations to the database.
-    """
-    
-    db = context.db
 
-    src_language_id = get_language_id(language_name=context.primary_language)
-    dictionary_db_map = state.get('dictionary_db_map', {})
-    created_translations = []
-    failed_translations = []
+    Every translation of every word is written with one executemany INSERT.
+    Translations are stored in the learning profile's foreign language.
+    The table has no unique key besides the id, so unlike words and
+    dictionary entries there is no conflict to skip with ON CONFLICT.
+    """
     
-    for word, dictionary_db in dictionary_db_map.items():
-        try:
-            translation = TranslationBase(
-                translation=state['translations'][word], 
-                language_id=src_language_id, 
-                dictionary_id=dictionary_db.id
-            )
-            translation_db = create_translation(db, translation, context.user)
-            created_translations.append(word)
-        except Exception as e:
-            print(f"Error creating translation for word '{word}': {e}")
-            failed_translations.append(word)
-            continue
+    created_translations, failed_translations = _bulk_save(
+        context.db, bulk_create_translations, state,
+        'translations', 'translation', context.foreign_language_id,
+        "no translation generated"
+    )
     
     return {
         'created_translations': created_translations,
@@ -458,28 +644,15 @@ def save_translation_node(state: State, context: Context) -> dict:
 def save_definition_node(state: State, context: Context) -> dict:
     """
     Node: Save definitions to the database.
-    """
-    
-    db = context.db
 
-    src_language_id = get_language_id(language_name=context.primary_language)
-    dictionary_db_map = state.get('dictionary_db_map', {})
-    created_definitions = []
-    failed_definitions = []
+    Every definition of every word is written with one executemany INSERT.
+    """
     
-    for word, dictionary_db in dictionary_db_map.items():
-        try:
-            definition = DefinitionBase(
-                dictionary_id=dictionary_db.id, 
-                language_id=src_language_id, 
-                definition_text=state['definitions'][word]
-            )
-            definition_db = create_definition(db, definition, context.user)
-            created_definitions.append(word)
-        except Exception as e:
-            print(f"Error creating definition for word '{word}': {e}")
-            failed_definitions.append(word)
-            continue
+    created_definitions, failed_definitions = _bulk_save(
+        context.db, bulk_create_definitions, state,
+        'definitions', 'definition_text', state.src_language_id,
+        "no definition generated"
+    )
     
     return {
         'created_definitions': created_definitions,
@@ -487,32 +660,22 @@ def save_definition_node(state: State, context: Context) -> dict:
     }
 
 @tool
-def save_example_node(state: State, context: LearningProfileRead) -> dict:
+def save_example_node(state: State, context: Context) -> dict:
     """
     Node: Save examples to the database.
+
+    Every example of every word is written with one executemany INSERT.
     """
- 
     
-    db = context.db
-
-    src_language_id = get_language_id(language_name=context.primary_language)
-    dictionary_db_map = state.get('dictionary_db_map', {})
-    created_examples = []
-
-    for word, dictionary_db in dictionary_db_map.items():
-        try:
-            example = ExampleBase(
-                dictionary_id=dictionary_db.id, 
-                language_id=src_language_id, 
-                example_text=state['examples'][word]
-            )
-            example_db = create_example(db, example, context.user)
-            created_examples.append(word)
-        except Exception as e:
-            continue
+    created_examples, failed_examples = _bulk_save(
+        context.db, bulk_create_examples, state,
+        'examples', 'example_text', state.src_language_id,
+        "no examples generated"
+    )
     
     return {
-        'created_examples': created_examples
+        'created_examples': created_examples,
+        'failed_examples': failed_examples
     }
 
 save_words_node = ToolNode([
@@ -538,26 +701,19 @@ graph.add_node("save_definition", save_definition_node)
 graph.add_node("save_example", save_example_node)
 
 graph.add_edge(START, "extract_saved_words")
+# Two branches run side by side: the LLM branch (translate -> definitions ->
+# examples) and the DB branch (save_text -> save_words -> save_dictionary ->
+# save_translation). Each save waits only for the generation step it writes,
+# so DB round trips overlap the LLM calls. At most one node touches the
+# shared session in any step.
 graph.add_edge("extract_saved_words", "translate_words")
+graph.add_edge("extract_saved_words", "save_text")
 graph.add_edge("translate_words", "generate_definitions")
 graph.add_edge("generate_definitions", "generate_examples")
-graph.add_edge("generate_examples", "get_synonyms")
-graph.add_edge("get_synonyms", "save_text")
-graph.add_edge("save_text", "save_words")
+graph.add_edge(["translate_words", "save_text"], "save_words")
 graph.add_edge("save_words", "save_dictionary")
 graph.add_edge("save_dictionary", "save_translation")
-graph.add_edge("save_translation", "save_definition")
-graph.add_edge("save_definition", "save_example")
-graph.add_edge("save_example", END)
-
-# Conditional edges for save_example node
-graph.add_conditional_edges(
-    "save_example",
-    lambda x: "created_examples" if x.get("created_examples") else "failed_examples",
-    {
-        "created_examples": END,
-        "failed_examples": END
-    }
-)
-
-
+graph.add_edge(["save_translation", "generate_definitions"], "save_definition")
+graph.add_edge(["save_definition", "generate_examples"], "save_example")
+graph.add_edge("save_example", "get_synonyms")
+graph.add_edge("get_synonyms", END)
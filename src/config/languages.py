@@ -0,0 +1,46 @@
+"""
+Supported languages: display names and ISO 639-1 codes.
+"""
+
+import sys
+from typing import Optional
+
+language_codes = {
+    "English": "en",
+    "Русский": "ru",
+    "한국어": "ko",
+    "中文": "zh",
+    "日本語": "ja",
+    "Español": "es",
+    "Français": "fr",
+    "Deutsch": "de",
+    "Italiano": "it",
+    "Português": "pt"
+}
+codes_language = {
+    "en":"English",
+    "ru":"Русский",
+    "ko":"한국어",
+    "zh":"中文",
+    "ja":"日本語",
+    "es":"Español",
+    "fr":"Français",
+    "de":"Deutsch",
+    "it":"Italiano",
+    "pt":"Português"
+}
+
+# Membership sets for request validation; a frozenset lookup is a single hash
+# probe, so validating a language tag costs the same for any input.
+SUPPORTED_LANGUAGES = frozenset(language_codes)
+SUPPORTED_LANGUAGE_CODES = frozenset(codes_language)
+
+# Codes keyed by case-folded display name, built once so lookups of e.g.
+# "english" don't need a scan; keys are interned like the validated names
+_CODES_BY_FOLDED_NAME = {sys.intern(name.casefold()): code for name, code in language_codes.items()}
+
+
+def language_code(name: str) -> Optional[str]:
+    """Return the code of a language display name, ignoring case, or None."""
+    # Exact display names (the common case) hit without allocating a folded copy
+    return language_codes.get(name) or _CODES_BY_FOLDED_NAME.get(name.casefold())
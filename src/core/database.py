@@ -8,20 +8,37 @@ from fastapi import Depends
 # Database connection URL from settings
 DATABASE_URL = settings.DATABASE_URL
 
-# Create SQLAlchemy engine with echo=True for debugging SQL queries
+# Create SQLAlchemy engine; SQL echo follows DEBUG, since logging every
+# statement costs more than the statement itself in bulk loops
 # future=True enables SQLAlchemy 2.0 style features
+# Statement reuse: SQLAlchemy caches the compiled SQL of every query shape per
+# engine, so repeated lookups (login, /users/me) skip Python-side compilation.
+# Server-side prepared statements need the psycopg 3 driver
+# (postgresql+psycopg://...), which prepares a query automatically once it
+# has run prepare_threshold (default 5) times on a connection; psycopg2 has
+# no equivalent.
 engine = create_engine(
     DATABASE_URL, 
-    echo=True,  # Log all SQL statements to console
-    future=True  # Enable SQLAlchemy 2.0 features
+    echo=settings.DEBUG,  # Log SQL statements to console in development only
+    future=True,  # Enable SQLAlchemy 2.0 features
+    pool_size=settings.DB_POOL_SIZE,  # Persistent connections kept in the pool
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Extra connections allowed under burst load
+    pool_pre_ping=True,  # Detect stale connections before handing them out
+    pool_recycle=settings.DB_POOL_RECYCLE  # Replace connections before server-side idle timeouts drop them
 )
 
 # Create session factory for database sessions
 # autocommit=False: Manual transaction control
 # autoflush=False: Manual flush control
+# expire_on_commit=False: Objects stay loaded after commit, so returning them
+#   (or the workflow's state) doesn't trigger a reload SELECT per object
+# Sessions are deliberately not thread-scoped: a workflow run passes its one
+# session to every node through the graph Context, so parallel branches
+# (which LangGraph runs on different threads) share the same transaction.
 SessionLocal = sessionmaker(
     autocommit=False, 
     autoflush=False, 
+    expire_on_commit=False,
     bind=engine
 )
 
@@ -5,11 +5,55 @@ from pathlib import Path
 from typing import Optional
 from src.config.settings import settings
 
+
+# Accepted level names; unknown names fall back to INFO instead of resolving
+# arbitrary attributes of the logging module
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+class LogCtx:
+    """
+    Structured context for a log call, passed as ``extra={'ctx': LogCtx(...)}``.
+
+    A slotted object is cheaper to build than a fresh ``extra`` dict and can
+    be created once per request and reused across log lines.
+    """
+    __slots__ = ("user_id", "action", "word", "language")
+
+    def __init__(
+        self,
+        user_id: Optional[int] = None,
+        action: Optional[str] = None,
+        word: Optional[str] = None,
+        language: Optional[str] = None
+    ):
+        self.user_id = user_id
+        self.action = action
+        self.word = word
+        self.language = language
+
+
+class SlotFilter(logging.Filter):
+    """Copy the fields of an attached LogCtx onto the record for formatters."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        ctx = getattr(record, "ctx", None)
+        if ctx is not None:
+            for name in ctx.__slots__:
+                setattr(record, name, getattr(ctx, name, None))
+        return True
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
-    max_bytes: int = 10 * 1024 * 1024,  # 10MB
-    backup_count: int = 5
+    max_bytes: int = 256 * 1024 * 1024,  # 256MB
+    backup_count: int = 3
 ) -> None:
     """
     Configure logging for the application.
@@ -28,7 +72,7 @@ def setup_logging(
     """
     
     # Convert string log level to logging constant
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    numeric_level = _LEVELS.get(log_level.upper(), logging.INFO) if isinstance(log_level, str) else log_level
     
     # Create formatter
     formatter = logging.Formatter(
@@ -43,6 +87,8 @@ def setup_logging(
     
     # Create file handler if log_file is specified
     handlers = [console_handler]
+    slot_filter = SlotFilter()
+    console_handler.addFilter(slot_filter)
     
     if log_file:
         # Ensure log directory exists
@@ -57,6 +103,7 @@ def setup_logging(
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
+        file_handler.addFilter(slot_filter)
         handlers.append(file_handler)
     
     # Configure root logger
@@ -1,6 +1,8 @@
 import json
-from typing import Optional, Any, Dict, List
+import orjson
+from typing import Optional, Any, Dict, List, Iterator
 from redis import Redis, ConnectionPool
+from redis.client import Pipeline
 from redis.exceptions import RedisError, ConnectionError
 from src.config.settings import settings
 from src.core.logging_config import get_logger
@@ -8,6 +10,18 @@ from src.core.logging_config import get_logger
 # Get logger for this module
 logger = get_logger(__name__)
 
+
+def _dumps(value: Any) -> bytes:
+    """
+    Serialize a value to JSON with orjson, falling back to str() for unknown types.
+
+    Values stay JSON rather than a binary format such as msgpack: the pool
+    decodes every reply as UTF-8 (decode_responses=True), plain strings are
+    stored unencoded next to serialized values, and keys written here are
+    read back by redis_functions and by hand through redis-cli.
+    """
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
 class RedisClient:
     """
     Redis client wrapper with connection management and utility methods.
@@ -36,6 +50,11 @@ class RedisClient:
         """Establish Redis connection with connection pooling."""
         try:
             # Create connection pool
+            kwargs.setdefault("max_connections", settings.REDIS_MAX_CONNECTIONS)
+            kwargs.setdefault("socket_keepalive", True)
+            # redis-py pings connections idle longer than this before reuse,
+            # so commands don't need their own liveness check
+            kwargs.setdefault("health_check_interval", settings.REDIS_HEALTH_CHECK_INTERVAL)
             self.connection_pool = ConnectionPool.from_url(
                 self.url,
                 decode_responses=True,  # Automatically decode responses to strings
@@ -54,14 +73,14 @@ class RedisClient:
             raise
     
     def _ensure_connection(self):
-        """Ensure Redis connection is available."""
+        """
+        Ensure a Redis client exists.
+
+        Stale pooled connections are handled by the pool's health check
+        interval, so this no longer sends a PING before every command.
+        """
         if not self.redis:
             self._connect()
-        try:
-            self.redis.ping()
-        except (RedisError, ConnectionError):
-            logger.warning("Redis connection lost, attempting to reconnect...")
-            self._connect()
     
     def set(self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False, xx: bool = False) -> bool:
         """
@@ -81,8 +100,8 @@ class RedisClient:
             self._ensure_connection()
             
             # Serialize value to JSON if it's not a string
-            if not isinstance(value, str):
-                value = json.dumps(value, default=str)
+            if not isinstance(value, (str, bytes)):
+                value = _dumps(value)
             
             return self.redis.set(key, value, ex=ex, nx=nx, xx=xx)
             
@@ -110,7 +129,7 @@ class RedisClient:
             
             # Try to deserialize JSON
             try:
-                return json.loads(value)
+                return orjson.loads(value)
             except json.JSONDecodeError:
                 return value
                 
@@ -118,6 +137,61 @@ class RedisClient:
             logger.error(f"Error getting key {key}: {e}")
             return default
     
+    def mget(self, *keys: str) -> List[Any]:
+        """
+        Get several values from Redis in one round trip.
+        
+        Args:
+            *keys: Redis keys
+            
+        Returns:
+            List of deserialized values, None for missing keys
+        """
+        if not keys:
+            return []
+        try:
+            self._ensure_connection()
+            result = []
+            for value in self.redis.mget(keys):
+                if value is None:
+                    result.append(None)
+                    continue
+                try:
+                    result.append(orjson.loads(value))
+                except json.JSONDecodeError:
+                    result.append(value)
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error getting keys {keys}: {e}")
+            return [None] * len(keys)
+    
+    def mset(self, mapping: Dict[str, Any], ex: Optional[int] = None) -> bool:
+        """
+        Set several key-value pairs in Redis in one pipelined round trip.
+        
+        Args:
+            mapping: Keys and values to store (values will be JSON serialized)
+            ex: Expiration time in seconds applied to every key
+            
+        Returns:
+            bool: True if operation was successful
+        """
+        if not mapping:
+            return True
+        try:
+            self._ensure_connection()
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in mapping.items():
+                if not isinstance(value, (str, bytes)):
+                    value = _dumps(value)
+                pipe.set(key, value, ex=ex)
+            return all(pipe.execute())
+            
+        except Exception as e:
+            logger.error(f"Error setting keys {list(mapping)}: {e}")
+            return False
+    
     def delete(self, *keys: str) -> int:
         """
         Delete one or more keys from Redis.
@@ -135,6 +209,42 @@ class RedisClient:
             logger.error(f"Error deleting keys {keys}: {e}")
             return 0
     
+    def unlink(self, *keys: str) -> int:
+        """
+        Remove one or more keys from Redis without blocking on freeing their memory.
+        
+        Unlike DEL, UNLINK drops the keys from the keyspace right away and
+        reclaims the memory on a background thread.
+        
+        Args:
+            *keys: Keys to remove
+            
+        Returns:
+            int: Number of keys removed
+        """
+        try:
+            self._ensure_connection()
+            return self.redis.unlink(*keys)
+        except Exception as e:
+            logger.error(f"Error unlinking keys {keys}: {e}")
+            return 0
+    
+    def pipeline(self, transaction: bool = False) -> Pipeline:
+        """
+        Get a pipeline for sending several commands in one round trip.
+        
+        Values go to Redis as given and replies come back raw, without the
+        JSON (de)serialization the other methods apply.
+        
+        Args:
+            transaction: Wrap the queued commands in MULTI/EXEC
+            
+        Returns:
+            Pipeline: redis-py pipeline, usable as a context manager
+        """
+        self._ensure_connection()
+        return self.redis.pipeline(transaction=transaction)
+    
     def exists(self, *keys: str) -> int:
         """
         Check if keys exist in Redis.
@@ -204,8 +314,8 @@ class RedisClient:
             # Serialize values to JSON
             serialized_mapping = {}
             for field, value in mapping.items():
-                if not isinstance(value, str):
-                    serialized_mapping[field] = json.dumps(value, default=str)
+                if not isinstance(value, (str, bytes)):
+                    serialized_mapping[field] = _dumps(value)
                 else:
                     serialized_mapping[field] = value
             
@@ -236,7 +346,7 @@ class RedisClient:
             
             # Try to deserialize JSON
             try:
-                return json.loads(value)
+                return orjson.loads(value)
             except json.JSONDecodeError:
                 return value
                 
@@ -262,7 +372,7 @@ class RedisClient:
             result = {}
             for field, value in hash_data.items():
                 try:
-                    result[field] = json.loads(value)
+                    result[field] = orjson.loads(value)
                 except json.JSONDecodeError:
                     result[field] = value
             
@@ -272,6 +382,49 @@ class RedisClient:
             logger.error(f"Error getting hash {name}: {e}")
             return {}
     
+    def hscan_chunks(self, name: str, count: int = 512) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a hash with HSCAN, one page of fields at a time.
+        
+        Only one page of values is held in memory, so large hashes can be
+        streamed instead of loaded whole like with hgetall. HSCAN may return
+        a field twice if the hash is resized during iteration; repeats are
+        dropped, so each field is yielded once.
+        
+        Errors are logged and re-raised: callers are usually mid-stream, and
+        stopping quietly would pass a truncated hash off as complete.
+        
+        Args:
+            name: Hash name
+            count: Fields Redis returns per HSCAN call (approximate)
+            
+        Yields:
+            Dict of deserialized field-value pairs for each page with new fields
+        """
+        try:
+            self._ensure_connection()
+            seen = set()
+            cursor = 0
+            while True:
+                cursor, page = self.redis.hscan(name, cursor, count=count)
+                chunk = {}
+                for field, value in page.items():
+                    if field in seen:
+                        continue
+                    seen.add(field)
+                    try:
+                        chunk[field] = orjson.loads(value)
+                    except json.JSONDecodeError:
+                        chunk[field] = value
+                if chunk:
+                    yield chunk
+                if cursor == 0:
+                    break
+                    
+        except Exception as e:
+            logger.error(f"Error scanning hash {name}: {e}")
+            raise
+    
     def lpush(self, name: str, *values: Any) -> int:
         """
         Push values to the left of a list.
@@ -289,8 +442,8 @@ class RedisClient:
             # Serialize values
             serialized_values = []
             for value in values:
-                if not isinstance(value, str):
-                    serialized_values.append(json.dumps(value, default=str))
+                if not isinstance(value, (str, bytes)):
+                    serialized_values.append(_dumps(value))
                 else:
                     serialized_values.append(value)
             
@@ -320,7 +473,7 @@ class RedisClient:
             
             # Try to deserialize JSON
             try:
-                return json.loads(value)
+                return orjson.loads(value)
             except json.JSONDecodeError:
                 return value
                 
@@ -348,7 +501,7 @@ class RedisClient:
             result = []
             for value in values:
                 try:
-                    result.append(json.loads(value))
+                    result.append(orjson.loads(value))
                 except json.JSONDecodeError:
                     result.append(value)
             
@@ -358,6 +511,47 @@ class RedisClient:
             logger.error(f"Error getting range from list {name}: {e}")
             return []
     
+    def lrange_chunks(self, name: str, start: int = 0, end: int = -1, chunk_size: int = 4096) -> Iterator[List[Any]]:
+        """
+        Iterate over a range of a list in LRANGE windows of chunk_size values.
+        
+        Negative indexes are resolved against the list length once, up
+        front; values pushed while iterating may shift the windows.
+        
+        Args:
+            name: List name
+            start: Start index
+            end: End index (inclusive)
+            chunk_size: Values fetched per LRANGE call
+            
+        Errors are logged and re-raised, as in hscan_chunks.
+            
+        Yields:
+            List of deserialized values for each window
+        """
+        try:
+            self._ensure_connection()
+            length = self.redis.llen(name)
+            start = max(start + length if start < 0 else start, 0)
+            end = min(end + length if end < 0 else end, length - 1)
+            while start <= end:
+                stop = min(start + chunk_size - 1, end)
+                values = self.redis.lrange(name, start, stop)
+                if not values:
+                    break
+                chunk = []
+                for value in values:
+                    try:
+                        chunk.append(orjson.loads(value))
+                    except json.JSONDecodeError:
+                        chunk.append(value)
+                yield chunk
+                start = stop + 1
+                
+        except Exception as e:
+            logger.error(f"Error getting range from list {name}: {e}")
+            raise
+    
     def sadd(self, name: str, *values: Any) -> int:
         """
         Add values to a set.
@@ -375,8 +569,8 @@ class RedisClient:
             # Serialize values
             serialized_values = []
             for value in values:
-                if not isinstance(value, str):
-                    serialized_values.append(json.dumps(value, default=str))
+                if not isinstance(value, (str, bytes)):
+                    serialized_values.append(_dumps(value))
                 else:
                     serialized_values.append(value)
             
@@ -404,7 +598,7 @@ class RedisClient:
             result = set()
             for member in members:
                 try:
-                    result.add(json.loads(member))
+                    result.add(orjson.loads(member))
                 except json.JSONDecodeError:
                     result.add(member)
             
@@ -414,6 +608,36 @@ class RedisClient:
             logger.error(f"Error getting set {name}: {e}")
             return set()
     
+    def sscan(self, name: str, count: int = 1000) -> List[Any]:
+        """
+        Get all members of a set by iterating it with SSCAN.
+        
+        Unlike SMEMBERS this does not block Redis while a large set is
+        serialized. SSCAN may return a member more than once, so the raw
+        members are deduplicated before decoding.
+        
+        Args:
+            name: Set name
+            count: Members Redis returns per SSCAN call
+            
+        Returns:
+            List of deserialized values
+        """
+        try:
+            self._ensure_connection()
+            result = []
+            for member in dict.fromkeys(self.redis.sscan_iter(name, count=count)):
+                try:
+                    result.append(orjson.loads(member))
+                except json.JSONDecodeError:
+                    result.append(member)
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error scanning set {name}: {e}")
+            return []
+    
     def close(self):
         """Close Redis connection."""
         if self.redis:
@@ -1,26 +1,34 @@
-from fastapi import Depends
-from typing import Generator
+import anyio
+from fastapi import HTTPException, status
+from redis.exceptions import RedisError
+import src.core.redis_client as redis_module
 from src.core.redis_client import get_redis_client, RedisClient
 
-def get_redis() -> Generator[RedisClient, None, None]:
+async def get_redis() -> RedisClient:
     """
     FastAPI dependency for Redis client.
-    
-    This dependency provides a Redis client instance to FastAPI endpoints.
-    The client is automatically managed and will be properly closed after use.
-    
-    Yields:
+
+    Returns the global client created at application startup. The dependency
+    is async so FastAPI calls it directly on the event loop instead of
+    dispatching it to the threadpool on every request. If Redis was down at
+    startup there is no client yet; connecting blocks on a ping, so that
+    retry runs in the threadpool, and a failure becomes a 503.
+
+    Returns:
         RedisClient: Redis client instance
-        
+
+    Raises:
+        HTTPException: 503 if Redis cannot be reached
+
     Example:
         @app.get("/cache/{key}")
         def get_cached_data(key: str, redis: RedisClient = Depends(get_redis)):
             return redis.get(key)
     """
-    redis_client = get_redis_client()
+    client = redis_module.redis_client
+    if client is not None:
+        return client
     try:
-        yield redis_client
-    finally:
-        # Note: We don't close the client here as it's a global instance
-        # The client will be closed when the application shuts down
-        pass
+        return await anyio.to_thread.run_sync(get_redis_client)
+    except RedisError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Redis unavailable") from e
@@ -5,8 +5,8 @@ This module provides direct function access to Redis operations,
 replacing the need for Redis endpoints in the API.
 """
 
-import json
-from typing import Optional, Any, Dict, List, Union
+import orjson
+from typing import Optional, Any, Dict, List, Tuple, Union
 from src.core.redis_client import RedisClient, get_redis_client
 from src.core.logging_config import get_logger
 
@@ -556,6 +556,85 @@ def is_set_member(set_name: str, value: Any) -> Dict[str, Any]:
         }
 
 
+def are_set_members(set_name: str, *values: Any) -> Dict[str, Any]:
+    """
+    Check several values for membership in a set with one SMISMEMBER call.
+    
+    Args:
+        set_name: Set name
+        *values: Values to check
+        
+    Returns:
+        Dict: Membership check result with a value -> bool mapping
+    """
+    if not values:
+        return {"set_name": set_name, "members": {}}
+    try:
+        redis = get_redis_client()
+        flags = redis.redis.smismember(set_name, values)
+        
+        return {
+            "set_name": set_name,
+            "members": {value: bool(flag) for value, flag in zip(values, flags)}
+        }
+    except Exception as e:
+        logger.error(f"Error checking set membership for {set_name}: {e}")
+        return {
+            "set_name": set_name,
+            "members": dict.fromkeys(values, False),
+            "error": str(e)
+        }
+
+
+# =============================================================================
+# Pipelined Operations
+# =============================================================================
+
+def pipeline_exec(ops: List[Tuple[str, tuple]], transaction: bool = False) -> Dict[str, Any]:
+    """
+    Run several Redis commands in a single round trip.
+    
+    Commands are queued on a pipeline and sent together, so a group of
+    independent operations costs one network round trip instead of one each.
+    Arguments that are not str/bytes/int/float are JSON serialized, like
+    values passed to the client wrapper. Replies are returned raw (strings
+    are not JSON-decoded).
+    
+    Args:
+        ops: (command, args) pairs, e.g. [("set", ("k", "v")), ("ttl", ("k",))]
+        transaction: Wrap the commands in MULTI/EXEC
+        
+    Returns:
+        Dict: Operation result with one reply per command, in order
+    
+    Example:
+        pipeline_exec([("get", ("user:123",)), ("ttl", ("user:123",))])
+    """
+    try:
+        redis = get_redis_client()
+        with redis.redis.pipeline(transaction=transaction) as pipe:
+            for command, args in ops:
+                args = tuple(
+                    arg if isinstance(arg, (str, bytes, int, float)) else orjson.dumps(arg, default=str)
+                    for arg in args
+                )
+                getattr(pipe, command)(*args)
+            results = pipe.execute()
+        
+        return {
+            "success": True,
+            "commands": [command for command, _ in ops],
+            "results": results
+        }
+    except Exception as e:
+        logger.error(f"Error executing pipeline {[command for command, _ in ops]}: {e}")
+        return {
+            "success": False,
+            "commands": [command for command, _ in ops],
+            "error": str(e)
+        }
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
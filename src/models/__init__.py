@@ -18,9 +18,12 @@ __all__ = [
     
     # Pydantic schemas
     'State',
+    'WordEntry',
+    'ExamplesItem',
     'TranslationResponse',
     'DefinitionResponse',
     'ExamplesResponse',
+    'WORD_LISTS_ADAPTER',
     'TranslationInput',
     'DefinitionInput',
     'ExamplesInput',
@@ -29,6 +32,10 @@ __all__ = [
     'ExamplesRead',
     'AllRead',
     'Context',
+    'CacheSetInput',
+    'CacheHashSetInput',
+    'CacheListPushInput',
+    'CacheSetAddInput',
     
     # CRUD schemas
     'WordBase',
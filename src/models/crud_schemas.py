@@ -113,7 +113,7 @@ class ExampleRead(ExampleBase):
 
 class TextBase(BaseModel):
     learning_profile_id: int
-    dictionary_id: int
+    dictionary_id: Optional[int] = None
     text: str = Field(..., min_length=1)
 
 class TextRead(TextBase):
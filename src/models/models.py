@@ -73,7 +73,7 @@ class User(Base, TimestampMixin):
     Attributes:
         id: Primary key
         username: Unique username for login
-        password: Hashed password (bcrypt)
+        password: Hashed password (argon2id, or bcrypt until next login)
         full_name: User's full name
         email: Unique email address
         disabled: Account status flag
@@ -85,7 +85,7 @@ class User(Base, TimestampMixin):
     
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, unique=True, index=True, nullable=False)
-    password = Column(String, nullable=False)  # Stored as bcrypt hash
+    password = Column(String, nullable=False)  # Stored as argon2id hash (older rows: bcrypt)
     full_name = Column(String, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
     disabled = Column(Boolean, default=False, nullable=False)
@@ -183,6 +183,11 @@ class Word(Base, TimestampMixin, EmbeddingMixin):
     dictionaries = relationship("Dictionary", back_populates="word")    
     user_word_progress = relationship("UserWordProgress", back_populates="word")
 
+    # Ensure unique lemma per language (conflict target for bulk upserts)
+    __table_args__ = (
+        UniqueConstraint('lemma', 'language_id', name='uq_word_lemma_language'),
+    )
+
 class UserWordProgress(Base, TimestampMixin):
     """
     User word progress tracking model.
@@ -1,26 +1,30 @@
-from pydantic import Field, BaseModel, EmailStr, field_validator, ValidationInfo, RootModel
+import sys
+from pydantic import Field, BaseModel, EmailStr, field_validator, ValidationInfo, ConfigDict, TypeAdapter
 
-from typing import List, Optional, Dict, Any, Set, TypedDict
+from typing import List, Optional, Dict, Any, Set, Tuple
 from src.models.crud_schemas import WordBase
 from src.core.database import get_db
 from src.models.crud_schemas import LearningProfileRead
+from src.models.models import User, PartOfSpeech
+from src.config.languages import codes_language, language_code
+from sqlalchemy.orm import Session
+from dataclasses import dataclass, field
 
-class TranslationResponse(RootModel[Dict[str, List[str]]]):
-    """
-    Response model for translation results.
-    
-    This model represents the structured output from AI translation services.
-    It maps words (lemmas) to their translations in the target language.
-    
-    Example:
-        {
-            "hello": ["hola", "buenos días"],
-            "world": ["mundo"],
-            "goodbye": ["adiós", "hasta luego"]
-        }
-    """
-    pass
+# Structured output of AI translation services: maps words (lemmas) to their
+# translations in the target language, e.g.
+#   {"hello": ["hola", "buenos días"], "world": ["mundo"]}
+# Kept as a plain dict type rather than a RootModel so responses need no
+# wrapper object or `.root` unwrapping.
+TranslationResponse = Dict[str, List[str]]
+
+# Shared validator for every word -> list-of-strings payload returned by the LLM
+# (translations, batched definitions and batched examples)
+WORD_LISTS_ADAPTER = TypeAdapter(Dict[str, List[str]])
  
+# Request/response schemas reject unknown fields (no extras scan on the
+# validation path) and are immutable once validated.
+STRICT_SCHEMA_CONFIG = ConfigDict(extra='forbid', frozen=True)
+
 class DefinitionResponse(BaseModel):
     """
     Response model for definition generation.
@@ -33,6 +37,8 @@ class DefinitionResponse(BaseModel):
     """
     definition: List[str] = Field(description="List of definition in the target language")
 
+    model_config = STRICT_SCHEMA_CONFIG
+
 class ExamplesResponse(BaseModel):
     """
     Response model for example generation.
@@ -45,6 +51,8 @@ class ExamplesResponse(BaseModel):
     """
     examples: List[str] = Field(description="List of usage examples in the target language")
 
+    model_config = STRICT_SCHEMA_CONFIG
+
 class TranslationInput(BaseModel):
     """
     Input model for translation requests.
@@ -60,6 +68,19 @@ class TranslationInput(BaseModel):
     src_language: str
     tgt_language: str
 
+    model_config = STRICT_SCHEMA_CONFIG
+
+    @field_validator("src_language", "tgt_language")
+    @classmethod
+    def intern_language(cls, v: str) -> str:
+        # Same folded lookup as create_language, so "english" works here too
+        code = language_code(v)
+        if code is None:
+            raise ValueError(f"Unsupported language: {v}")
+        # A handful of language names repeat on every request; interning
+        # makes them share one object with a cached hash
+        return sys.intern(codes_language[code])
+
 class DefinitionInput(WordBase):
     """
     Input model for definition generation requests.
@@ -72,6 +93,8 @@ class DefinitionInput(WordBase):
     """
     context: Optional[str] = None
 
+    model_config = STRICT_SCHEMA_CONFIG
+
 class ExamplesInput(WordBase):
     """
     Input model for example generation requests.
@@ -85,6 +108,8 @@ class ExamplesInput(WordBase):
     examples_number: Optional[int] = 1
     definition: Optional[str] = None
 
+    model_config = STRICT_SCHEMA_CONFIG
+
 class TranslationRead(TranslationInput):
     """
     Complete translation response model.
@@ -97,33 +122,67 @@ class TranslationRead(TranslationInput):
     """
     words: TranslationResponse
 
-class DefinitionRead(DefinitionInput, DefinitionResponse):
+class DefinitionRead(DefinitionInput):
     """
     Complete definition response model.
     
     This model combines the input parameters with the definition results
     to provide a complete response for definition requests.
+    
+    Attributes:
+        definition: List of definitions in the target language
     """
-    pass
+    definition: List[str] = Field(description="List of definition in the target language")
 
-class ExamplesRead(ExamplesInput, ExamplesResponse):
+class ExamplesRead(ExamplesInput):
     """
     Complete examples response model.
     
     This model combines the input parameters with the example results
     to provide a complete response for example generation requests.
+    
+    Attributes:
+        examples: List of usage examples in the target language
     """
-    pass
+    examples: List[str] = Field(description="List of usage examples in the target language")
 
-class AllRead(TranslationInput, DefinitionRead, ExamplesRead):
+class AllRead(BaseModel):
     """
     Comprehensive response model for all language processing services.
     
     This model combines translation, definition, and example generation
     into a single comprehensive response. It's useful for workflows that
     need all three types of language processing.
+    
+    Fields are listed flat instead of inherited from the three *Read
+    models, so the schema has no diamond MRO to resolve.
+    
+    Attributes:
+        text: The input text that was translated
+        src_language: Source language name
+        tgt_language: Target language name
+        words: Translation results mapping words to their translations
+        lemma: The word that was defined and exemplified
+        pos: Part of speech of the word
+        language_id: Language of the word
+        context: Optional context sentence used for the definition
+        examples_number: Number of examples generated
+        definition: Definition used to guide example generation
+        examples: List of usage examples
     """
-    pass
+    text: str
+    src_language: str
+    tgt_language: str
+    words: TranslationResponse
+    lemma: str = Field(..., min_length=1, max_length=255)
+    pos: Optional[PartOfSpeech] = None
+    language_id: int
+    context: Optional[str] = None
+    examples_number: Optional[int] = 1
+    definition: Optional[str] = None
+    examples: List[str] = Field(description="List of usage examples in the target language")
+
+    model_config = STRICT_SCHEMA_CONFIG
 
 class Context(LearningProfileRead):
     """
@@ -131,39 +190,121 @@ class Context(LearningProfileRead):
     
     This model extends LearningProfileRead to include additional context
     for language processing workflows.
+    
+    Attributes:
+        db: Request-scoped database session shared by every save node, so a
+            workflow run is written in a single transaction
+        user: Current authenticated user
+    """
+    db: Session = Field(exclude=True)
+    user: User = Field(exclude=True)
+
+    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+
+    @property
+    def learning_profile_id(self) -> int:
+        return self.id
+
+@dataclass(slots=True)
+class WordEntry:
+    """
+    Everything the workflow generates for a single word.
+
+    Nodes fetch a word's entry once and read or extend its fields, instead
+    of looking the word up in one parallel dict per attribute.
+
+    Attributes:
+        translations: Translations into the target language
+        definitions: Definitions in the source language
+        examples: Usage examples in the source language
+        examples_number: Number of examples to generate
+        synonyms: Similar words from the learning profile's dictionary
+    """
+    translations: List[str] = field(default_factory=list)
+    definitions: List[str] = field(default_factory=list)
+    examples: List[str] = field(default_factory=list)
+    examples_number: int = 1
+    synonyms: List[str] = field(default_factory=list)
+
+@dataclass(slots=True, frozen=True)
+class ExamplesItem:
+    """
+    One word of an internal batch example-generation request.
+
+    Workflow nodes build these from data that is already validated, so the
+    batch path skips ExamplesInput's pydantic validation; ExamplesInput is
+    still used at the API boundary.
+
+    Attributes:
+        word: Word to generate examples for
+        examples_number: Number of examples to generate
+        definition: Optional definition to guide example generation
     """
-    pass
+    word: str
+    examples_number: int = 1
+    definition: Optional[str] = None
 
-class State(TypedDict):
+@dataclass(slots=True)
+class State:
     """
     Workflow state model for language processing pipelines.
     
     This model represents the state of a language processing workflow,
-    tracking various intermediate results and processing status.
+    tracking various intermediate results and processing status. It is a
+    slots dataclass, so nodes read fields by attribute (a fixed slot)
+    rather than by key from a per-run dict.
     
     Attributes:
         text: Original input text
-        src_language: Source language
-        tgt_language: Target language
-        words: Set of extracted words
-        translations: Dictionary mapping words to translations
-        definitions: Dictionary mapping words to definitions
-        examples: Dictionary mapping words to examples
-        examples_number: Dictionary mapping words to number of examples
-        similar_words: Dictionary mapping words to similar words
+        src_language: Source language code
+        tgt_language: Target language code
+        text_id: ID of the saved input text
+        src_language_id: ID of the source language, resolved once per run
+        src_language_name: Source language name, resolved once per run
+        tgt_language_name: Target language name, resolved once per run
+        chunks: Text chunks mapped to the (lemma, pos, lang) tuples still missing from the dictionary
+        entries: Dictionary mapping each extracted word to its WordEntry
+        dictionaries: Dictionary mapping saved words to their dictionary IDs
+        word_ids: Dictionary mapping saved words to their word IDs
         saved_to_db: Flag indicating if results were saved
         created_words: List of words that were successfully created
         existing_words: List of words that already existed in the database  
+        created_dictionary_entries: Words newly added to the dictionary
+        existing_dictionary_entries: Words that were already in the dictionary
+        created_translations: Words whose translations were saved
+        created_definitions: Words whose definitions were saved
+        created_examples: Words whose examples were saved
+        failed_translations: {"word", "reason"} records of translations that were not saved
+        failed_definitions: {"word", "reason"} records of definitions that were not saved
+        failed_examples: {"word", "reason"} records of examples that were not saved
     """
-    text: str  
-    words: Set[str] = Field(default_factory=set, description="Set of extracted words")
-    translations: Dict[str, List[str]] = Field(default_factory=dict, description="Dictionary mapping words to translations")
-    definitions: Dict[str, List[str]] = Field(default_factory=dict, description="Dictionary mapping words to definitions")
-    examples: Dict[str, List[str]] = Field(default_factory=dict, description="Dictionary mapping words to examples")
-    examples_number: Dict[str, int] = Field(default_factory=dict, description="Dictionary mapping words to number of examples")
-    synonyms: Dict[str, List[str]] = Field(default_factory=dict, description="Dictionary mapping words to similar words")
-    dictionaries: Dict[str, int] = Field(default_factory=dict, description="Dictionary mapping words to dictionary IDs")
-    saved_to_db: bool = Field(default=False, description="Flag indicating if results were saved")
+    text: str
+    src_language: str
+    tgt_language: str
+    text_id: Optional[int] = None
+    src_language_id: Optional[int] = None
+    src_language_name: Optional[str] = None
+    tgt_language_name: Optional[str] = None
+    chunks: Dict[str, Set[Tuple[str, str, str]]] = field(default_factory=dict)
+    entries: Dict[str, WordEntry] = field(default_factory=dict)
+    dictionaries: Dict[str, int] = field(default_factory=dict)
+    word_ids: Dict[str, int] = field(default_factory=dict)
+    saved_to_db: bool = False
+    created_words: List[str] = field(default_factory=list)
+    existing_words: List[str] = field(default_factory=list)
+    created_dictionary_entries: List[str] = field(default_factory=list)
+    existing_dictionary_entries: List[str] = field(default_factory=list)
+    created_translations: List[str] = field(default_factory=list)
+    created_definitions: List[str] = field(default_factory=list)
+    created_examples: List[str] = field(default_factory=list)
+    failed_translations: List[Dict[str, str]] = field(default_factory=list)
+    failed_definitions: List[Dict[str, str]] = field(default_factory=list)
+    failed_examples: List[Dict[str, str]] = field(default_factory=list)
+
+    def __post_init__(self):
+        # Language codes are used as lookup keys by every node
+        self.src_language = sys.intern(self.src_language)
+        self.tgt_language = sys.intern(self.tgt_language)
 
 class Output(BaseModel):
     """
@@ -178,3 +319,59 @@ class Output(BaseModel):
     created_translations: List[str]
     created_definitions: List[str]
     created_examples: List[str]
+
+    model_config = STRICT_SCHEMA_CONFIG
+
+class CacheSetInput(BaseModel):
+    """
+    Input model for storing a single value in the Redis cache.
+
+    Attributes:
+        key: Cache key
+        value: Value to cache (JSON serialized)
+        expiration: Expiration time in seconds (default: 1 hour)
+    """
+    key: str
+    value: Any
+    expiration: Optional[int] = 3600
+
+    model_config = STRICT_SCHEMA_CONFIG
+
+class CacheHashSetInput(BaseModel):
+    """
+    Input model for setting fields of a Redis hash.
+
+    Attributes:
+        hash_name: Hash name
+        data: Field-value pairs to set
+    """
+    hash_name: str
+    data: Dict[str, Any]
+
+    model_config = STRICT_SCHEMA_CONFIG
+
+class CacheListPushInput(BaseModel):
+    """
+    Input model for pushing values onto a Redis list.
+
+    Attributes:
+        list_name: List name
+        values: Values to push
+    """
+    list_name: str
+    values: List[Any]
+
+    model_config = STRICT_SCHEMA_CONFIG
+
+class CacheSetAddInput(BaseModel):
+    """
+    Input model for adding members to a Redis set.
+
+    Attributes:
+        set_name: Set name
+        values: Values to add
+    """
+    set_name: str
+    values: List[Any]
+
+    model_config = STRICT_SCHEMA_CONFIG
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Annotated, Optional, Dict, Any, List
-from sqlalchemy.orm import Session, selectinload
+from typing import Annotated, Optional, Dict, Any, List, Iterable, Tuple
+from sqlalchemy.orm import Session, selectinload, raiseload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime
@@ -15,19 +16,58 @@ from src.models.models import (
     User, Language, Word, LearningProfile, Dictionary, Translation, Definition, Example, Text
 )
 from src.core.database import get_db
+from src.config.settings import settings
 from src.services import auth
+from src.utils.cache import LRUCache
 from datetime import timedelta
-from src.services.generate import embed, language_codes
+from itertools import batched
+from src.services.generate import embed, embed_batch, EMBEDDINGS_MODEL_NAME
+from src.config.languages import codes_language, language_code
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import func, alias
+from sqlalchemy import func, alias, literal_column, insert, select, exists
+
+# Bound once so list conversions call pydantic-core directly instead of going
+# through BaseModel.model_validate for every row
+_validate_word_read = WordRead.__pydantic_validator__.validate_python
+
+_TRUSTED_CONSTRUCT = settings.TRUSTED_CONSTRUCT and not settings.DEBUG
+
+# UserRead only carries User's own columns, so user lookups never need a
+# relationship; debug builds make any lazy load on them fail loudly
+_USER_LOAD_OPTIONS = (raiseload("*"),) if settings.DEBUG else ()
+
+
+def to_user_read(user: User) -> UserRead:
+    """
+    Convert a User row to UserRead.
+
+    Rows loaded from the database are already well-typed, so outside of debug
+    builds the model is built with model_construct and skips validation.
+    """
+    if not _TRUSTED_CONSTRUCT:
+        return UserRead.model_validate(user)
+    return UserRead.model_construct(
+        id=user.id,
+        username=user.username,
+        full_name=user.full_name,
+        email=user.email,
+        disabled=user.disabled,
+    )
+
+
+def _row_exists(db: Session, *criteria) -> bool:
+    """
+    Check for a matching row with SELECT EXISTS, without loading it.
+
+    Duplicate checks only need a yes/no; fetching the row with .first()
+    would transfer and build a full ORM object (for words, embedding included).
+    """
+    return db.execute(select(exists().where(*criteria))).scalar()
 
 
 def register_user(db: Session, payload: UserCreate) -> UserRead:
     email_norm = payload.email.strip().lower()
-    existing_user = db.query(User).filter(
-        (User.username == payload.username) | (User.email == email_norm)
-    ).first()
-    if existing_user:
+    if _row_exists(db, (User.username == payload.username) | (User.email == email_norm)):
         raise HTTPException(status_code=409, detail="Username or email already registered")
 
     db_user = User(
@@ -58,17 +98,18 @@ def login(db: Session, username: str, password: str) -> Token:
 
 
 def get_user_info(db: Session, user_id: Optional[int] = None, username: Optional[str] = None) -> UserRead:
+    query = db.query(User).options(*_USER_LOAD_OPTIONS)
     if user_id and username:
-        user = db.query(User).filter((User.username == username) & (User.id == user_id)).first()
+        user = query.filter((User.username == username) & (User.id == user_id)).first()
     elif user_id:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = query.filter(User.id == user_id).first()
     elif username:
-        user = db.query(User).filter(User.username == username).first()
+        user = query.filter(User.username == username).first()
     else:
         raise HTTPException(status_code=400, detail="Must provide either user_id or username")
     if not user:
         raise HTTPException(status_code=400, detail="User not found")
-    return UserRead.model_validate(user)
+    return to_user_read(user)
 
 
 def delete_current_user(db: Session, current_user: User, hard: bool) -> None:
@@ -90,17 +131,16 @@ def delete_current_user(db: Session, current_user: User, hard: bool) -> None:
 
 
 def create_language(db: Session, language: LanguageBase) -> LanguageRead:
-    code = language_codes.get(language.name)
+    code = language_code(language.name)
     if not code:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid language")
+    # Store the canonical display name whatever casing the request used
+    name = codes_language[code]
 
-    existing_language = (
-        db.query(Language).filter((Language.name == language.name) | (Language.code == code)).first()
-    )
-    if existing_language:
+    if _row_exists(db, (Language.name == name) | (Language.code == code)):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Language already exists")
 
-    db_language = Language(name=language.name, code=code)
+    db_language = Language(name=name, code=code)
     db.add(db_language)
     db.commit()
     db.refresh(db_language)
@@ -144,12 +184,7 @@ def create_word(
     if not language:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Language doesn't exist")
 
-    exists = (
-        db.query(Word)
-        .filter((Word.lemma == word.lemma) & (Word.language_id == word.language_id))
-        .first()
-    )
-    if exists:
+    if _row_exists(db, Word.lemma == word.lemma, Word.language_id == word.language_id):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Word already exists")
 
     embedding_doc = embed(word.lemma)
@@ -168,8 +203,172 @@ def create_word(
     return WordRead.model_validate(db_word, from_attributes=True)
 
 
+# Maximum number of rows sent in one bulk INSERT statement
+UPSERT_BATCH_SIZE = 500
+
+
+def upsert_words(
+    db: Session,
+    lemmas: Iterable[str],
+    language_id: int
+) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Insert many words of one language with a single bulk upsert.
+
+    Existing lemmas are looked up with one SELECT, embeddings are generated
+    for the missing ones only, and those are written with
+    INSERT ... ON CONFLICT DO NOTHING RETURNING statements of at most
+    UPSERT_BATCH_SIZE rows each, which keeps long texts from building one
+    huge statement and embedding batch.
+
+    Nothing is committed: the caller owns the transaction.
+
+    Args:
+        db: SQLAlchemy session
+        lemmas: Lemmas to store
+        language_id: Language of all lemmas
+
+    Returns:
+        Tuple[Dict[str, int], List[str]]: Mapping of every lemma to its word id,
+        and the lemmas that were newly created
+    """
+    lemmas = list(dict.fromkeys(lemmas))
+    if not lemmas:
+        return {}, []
+
+    word_ids: Dict[str, int] = dict(
+        db.query(Word.lemma, Word.id)
+        .filter(Word.language_id == language_id, Word.lemma.in_(lemmas))
+        .all()
+    )
+    missing = [lemma for lemma in lemmas if lemma not in word_ids]
+    if not missing:
+        return word_ids, []
+
+    created: List[str] = []
+    for chunk in batched(missing, UPSERT_BATCH_SIZE):
+        rows = [
+            {
+                "lemma": lemma,
+                "language_id": language_id,
+                "embedding": embedding,
+                "embedding_model": EMBEDDINGS_MODEL_NAME,
+            }
+            for lemma, embedding in zip(chunk, embed_batch(list(chunk)))
+        ]
+        stmt = (
+            pg_insert(Word)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Word.lemma, Word.language_id])
+            .returning(Word.lemma, Word.id)
+        )
+        inserted = db.execute(stmt).all()
+        word_ids.update(inserted)
+        created.extend(lemma for lemma, _ in inserted)
+
+    # Rows skipped by ON CONFLICT were inserted concurrently by another transaction
+    if len(created) < len(missing):
+        raced = [lemma for lemma in missing if lemma not in word_ids]
+        word_ids.update(
+            db.query(Word.lemma, Word.id)
+            .filter(Word.language_id == language_id, Word.lemma.in_(raced))
+            .all()
+        )
+
+    return word_ids, created
+
+
+def create_words(db: Session, words: List[WordBase]) -> List[WordRead]:
+    """
+    Create many words in one request.
+
+    Lemmas are grouped by language and stored with upsert_words, so each
+    group is embedded in one model call and inserted with bulk statements;
+    the whole request is committed once. Lemmas that already exist are
+    skipped rather than rejected.
+
+    Args:
+        db: SQLAlchemy session
+        words: Words to create
+
+    Returns:
+        List[WordRead]: The newly created words
+    """
+    lemmas_by_language: Dict[int, List[str]] = {}
+    for word in words:
+        lemmas_by_language.setdefault(word.language_id, []).append(word.lemma)
+    if not lemmas_by_language:
+        return []
+
+    known = db.query(Language.id).filter(Language.id.in_(lemmas_by_language)).count()
+    if known < len(lemmas_by_language):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Language doesn't exist")
+
+    created_words: List[WordRead] = []
+    for language_id, lemmas in lemmas_by_language.items():
+        word_ids, created = upsert_words(db, lemmas, language_id)
+        created_words.extend(
+            _validate_word_read({"id": word_ids[lemma], "lemma": lemma, "language_id": language_id})
+            for lemma in created
+        )
+    db.commit()
+    return created_words
+
+
+def upsert_dictionary_entries(
+    db: Session,
+    learning_profile_id: int,
+    word_ids: Dict[str, int]
+) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Add many words to a learning profile's dictionary in bulk statements.
+
+    Uses INSERT ... ON CONFLICT (learning_profile_id, word_id) DO UPDATE
+    RETURNING (UPSERT_BATCH_SIZE rows per statement) so that both new and
+    already existing entries yield their id without a follow-up SELECT. The no-op update only exists to make
+    RETURNING include conflicting rows; `xmax = 0` tells inserted rows apart.
+
+    The learning profile must already be known to belong to the caller.
+    Nothing is committed: the caller owns the transaction.
+
+    Args:
+        db: SQLAlchemy session
+        learning_profile_id: Learning profile the entries belong to
+        word_ids: Mapping of word to word id
+
+    Returns:
+        Tuple[Dict[str, int], List[str]]: Mapping of every word to its dictionary id,
+        and the words whose dictionary entry was newly created
+    """
+    if not word_ids:
+        return {}, []
+
+    words_by_id = {word_id: word for word, word_id in word_ids.items()}
+    dictionary_ids: Dict[str, int] = {}
+    created: List[str] = []
+    for chunk in batched(words_by_id, UPSERT_BATCH_SIZE):
+        stmt = pg_insert(Dictionary).values([
+            {"learning_profile_id": learning_profile_id, "word_id": word_id}
+            for word_id in chunk
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Dictionary.learning_profile_id, Dictionary.word_id],
+            set_={"word_id": stmt.excluded.word_id},
+        ).returning(Dictionary.word_id, Dictionary.id, literal_column("xmax = 0"))
+
+        for word_id, dictionary_id, inserted in db.execute(stmt):
+            word = words_by_id[word_id]
+            dictionary_ids[word] = dictionary_id
+            if inserted:
+                created.append(word)
+    return dictionary_ids, created
+
+
 def create_in_dictionary(
-    db: Session, dictionary: DictionaryBase, current_user: Annotated[User, Depends(auth.get_current_active_user)]
+    db: Session,
+    dictionary: DictionaryBase,
+    current_user: Annotated[User, Depends(auth.get_current_active_user)],
+    commit: bool = True
 ) -> DictionaryRead:
     lp = (
         db.query(LearningProfile)
@@ -182,28 +381,29 @@ def create_in_dictionary(
     if lp is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden: profile doesn't belong to you")
 
-    exists = (
-        db.query(Dictionary)
-        .filter(
-            (Dictionary.learning_profile_id == dictionary.learning_profile_id)
-            & (Dictionary.word_id == dictionary.word_id)
-        )
-        .first()
-    )
-    if exists:
+    if _row_exists(
+        db,
+        Dictionary.learning_profile_id == dictionary.learning_profile_id,
+        Dictionary.word_id == dictionary.word_id,
+    ):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="This word already exists in your dictionary")
 
     create_dictionary = Dictionary(**dictionary.model_dump())
     db.add(create_dictionary)
-    db.commit()
-    db.refresh(create_dictionary)
+    # The flush's INSERT ... RETURNING fills in the id, and expire_on_commit
+    # is off, so no refresh SELECT is needed
+    if commit:
+        db.commit()
+    else:
+        db.flush()
     return DictionaryRead.model_validate(create_dictionary, from_attributes=True)
 
 
 def create_translation(
     db: Session, 
     translation: TranslationBase, 
-    current_user: Annotated[User, Depends(auth.get_current_active_user)]
+    current_user: Annotated[User, Depends(auth.get_current_active_user)],
+    commit: bool = True
 ) -> TranslationRead:
     lang = db.query(Language).filter(Language.id == translation.language_id).first()
     if lang is None:
@@ -226,15 +426,73 @@ def create_translation(
         translation=translation.translation,
     )
     db.add(row)
-    db.commit()
-    db.refresh(row)
+    # The flush's INSERT ... RETURNING fills in the id; see create_in_dictionary
+    if commit:
+        db.commit()
+    else:
+        db.flush()
     return TranslationRead.model_validate(row, from_attributes=True)
 
 
+def create_translations(
+    db: Session,
+    translations: List[TranslationBase],
+    current_user: User
+) -> List[TranslationRead]:
+    """
+    Create many translations with one multi-row INSERT ... RETURNING.
+
+    Languages and dictionary ownership are checked with one query each
+    instead of per row, and the whole batch is committed once.
+
+    Args:
+        db: SQLAlchemy session
+        translations: Translations to create
+        current_user: Owner of every referenced dictionary entry
+
+    Returns:
+        List[TranslationRead]: Created translations, in input order
+    """
+    if not translations:
+        return []
+
+    language_ids = {t.language_id for t in translations}
+    if db.query(Language.id).filter(Language.id.in_(language_ids)).count() < len(language_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Language not found")
+
+    dictionary_ids = {t.dictionary_id for t in translations}
+    owners = dict(
+        db.query(Dictionary.id, LearningProfile.user_id)
+        .join(LearningProfile, Dictionary.learning_profile_id == LearningProfile.id)
+        .filter(Dictionary.id.in_(dictionary_ids))
+        .all()
+    )
+    if len(owners) < len(dictionary_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dictionary entry not found")
+    if any(user_id != current_user.id for user_id in owners.values()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden: dictionary entry doesn't belong to you")
+
+    rows = [t.model_dump(include={"dictionary_id", "language_id", "translation"}) for t in translations]
+    created: List[TranslationRead] = []
+    for chunk in batched(rows, UPSERT_BATCH_SIZE):
+        stmt = (
+            insert(Translation)
+            .values(list(chunk))
+            .returning(Translation.id, Translation.dictionary_id, Translation.language_id, Translation.translation)
+        )
+        created.extend(
+            TranslationRead(id=id_, dictionary_id=dictionary_id, language_id=language_id, translation=translation)
+            for id_, dictionary_id, language_id, translation in db.execute(stmt)
+        )
+    db.commit()
+    return created
+
+
 def create_text(
     db: Session, 
     text: TextBase, 
-    learning_profile_id: int
+    learning_profile_id: int,
+    commit: bool = True
     ) -> TextRead:
 
     new_text = Text(
@@ -244,18 +502,24 @@ def create_text(
     )
     db.add(new_text)
     try:
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not create text: {str(e)}")
     db.refresh(new_text)
     return TextRead.model_validate(new_text, from_attributes=True)
 
-def create_definition(db: Session, definition: DefinitionBase) -> DefinitionRead:
+def create_definition(db: Session, definition: DefinitionBase, commit: bool = True) -> DefinitionRead:
     try:
         definition_db = Definition(**definition.model_dump())
         db.add(definition_db)
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
         db.refresh(definition_db)
         return DefinitionRead.model_validate(definition_db, from_attributes=True)
     except Exception as e:
@@ -264,12 +528,16 @@ def create_definition(db: Session, definition: DefinitionBase) -> DefinitionRead
 
 def create_example(
     db: Session, 
-    example: ExampleBase
+    example: ExampleBase,
+    commit: bool = True
 ) -> ExampleRead:
     try:
         example_db = Example(**example.model_dump())
         db.add(example_db)
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
         db.refresh(example_db)
         return ExampleRead.model_validate(example_db, from_attributes=True)
     except Exception as e:
@@ -277,6 +545,40 @@ def create_example(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not create example: {str(e)}")
 
 
+def bulk_create_translations(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert many translation rows with a single executemany statement.
+
+    Rows are trusted internal data (dictionary_id, language_id, translation)
+    and skip per-row validation and ORM unit-of-work bookkeeping.
+    Nothing is committed: the caller owns the transaction.
+    """
+    if rows:
+        db.execute(insert(Translation), rows)
+
+
+def bulk_create_definitions(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert many definition rows with a single executemany statement.
+
+    Rows are trusted internal data (dictionary_id, language_id, definition_text).
+    Nothing is committed: the caller owns the transaction.
+    """
+    if rows:
+        db.execute(insert(Definition), rows)
+
+
+def bulk_create_examples(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert many example rows with a single executemany statement.
+
+    Rows are trusted internal data (dictionary_id, language_id, example_text).
+    Nothing is committed: the caller owns the transaction.
+    """
+    if rows:
+        db.execute(insert(Example), rows)
+
+
 def get_synonyms(
     db: Session,
     word: str,
@@ -331,7 +633,7 @@ def get_synonyms(
         .all()
     )  
 
-    return [WordRead.model_validate(w, from_attributes=True) for w in neighbors]
+    return [_validate_word_read(w, from_attributes=True) for w in neighbors]
 
 def get_learning_profile(
     db: Session, 
@@ -360,21 +662,28 @@ def get_learning_profile(
         
     return LearningProfileRead.model_validate(learning_profile, from_attributes=True)
 
+# Language rows are created once and never renamed or deleted, so their ids
+# can be remembered for the life of the process. Misses are not cached, so a
+# language added later is found on the next lookup.
+_language_ids = LRUCache(maxsize=256)
+
+
 def get_language_id(db: Session, language_name: Optional[str]=None, language_code: Optional[str]=None) -> int:
 
     if language_name:
-        language = db.query(Language).filter(Language.name == language_name).first()
-        if not language:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Language not found")
-        return language.id
+        key, column = ("name", language_name), Language.name == language_name
+    elif language_code:
+        key, column = ("code", language_code), Language.code == language_code
+    else:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No language provided")
 
-    if language_code:
-        language = db.query(Language).filter(Language.code == language_code).first()
-        if not language:
+    language_id = _language_ids.get(key)
+    if language_id is None:
+        language_id = db.execute(select(Language.id).where(column)).scalar()
+        if language_id is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Language not found")
-        return language.id
-
-    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No language provided")
+        _language_ids.set(key, language_id)
+    return language_id
 
 
 def update_word(
@@ -420,12 +729,12 @@ def update_word(
     # Update fields
     if updates.lemma != word.lemma:
         # Check for duplicates if lemma is being changed
-        existing = db.query(Word).filter(
+        if _row_exists(
+            db,
             Word.lemma == updates.lemma,
             Word.language_id == word.language_id,
             Word.id != word_id
-        ).first()
-        if existing:
+        ):
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Word already exists")
         
         word.lemma = updates.lemma
@@ -445,12 +754,12 @@ def update_word(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Language not found")
         
         # Check for duplicates in new language
-        existing = db.query(Word).filter(
+        if _row_exists(
+            db,
             Word.lemma == word.lemma,
             Word.language_id == updates.language_id,
             Word.id != word_id
-        ).first()
-        if existing:
+        ):
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Word already exists in this language")
         
         word.language_id = updates.language_id
@@ -596,13 +905,11 @@ def update_current_user(db: Session, current_user: User, payload: UserUpdate) ->
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields to update")
 
     if payload.username and payload.username != current_user.username:
-        exists = db.query(User).filter(User.username == payload.username).first()
-        if exists:
+        if _row_exists(db, User.username == payload.username):
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Username already taken")
 
     if payload.email and payload.email != current_user.email:
-        exists = db.query(User).filter(User.email == payload.email).first()
-        if exists:
+        if _row_exists(db, User.email == payload.email):
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
 
     if payload.username is not None:
@@ -617,7 +924,7 @@ def update_current_user(db: Session, current_user: User, payload: UserUpdate) ->
     db.add(current_user)
     db.commit()
     db.refresh(current_user)
-    return UserRead.model_validate(current_user)
+    return to_user_read(current_user)
 
 def update_definition(
     db: Session,
@@ -1,6 +1,6 @@
 from langchain_ollama import ChatOllama
-from langchain.prompts import ChatPromptTemplate
-from src.models.schemas import TranslationResponse, DefinitionResponse, ExamplesResponse, DefinitionRead, ExamplesRead, TranslationRead
+from src.services.prompts import TRANSLATION_TMPL, DEFINITION_TMPL, DEFINITIONS_BATCH_TMPL, EXAMPLES_BATCH_TMPL
+from src.models.schemas import DefinitionResponse, DefinitionRead, ExamplesRead, TranslationRead, WORD_LISTS_ADAPTER, ExamplesItem
 from typing import Optional
 from dotenv import load_dotenv
 from langsmith import traceable
@@ -8,7 +8,12 @@ from pathlib import Path
 from typing import List
 from langchain_community.embeddings import HuggingFaceEmbeddings
 import os
-from typing import List, Dict
+import hashlib
+from src.core.redis_client import get_redis_client
+from src.utils.cache import LRUCache
+from src.utils.batch import MicroBatcher
+from src.config.languages import language_codes, codes_language
+from typing import Any, List, Dict, Tuple, Iterable
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langsmith import traceable
@@ -30,19 +35,30 @@ load_dotenv(dotenv_path=env_path)
 # You can override these via your project's .env
 #   EMBEDDINGS_MODEL_NAME=all-MiniLM-L6-v2
 #   EMBEDDINGS_DEVICE=cuda   (or "cpu", "mps" on Apple Silicon)
+#   EMBEDDINGS_BATCH_SIZE=64
 # -----------------------------------------------------------------------------
 
 # Model configuration from environment variables
 EMBEDDINGS_MODEL_NAME = os.getenv("EMBEDDINGS_MODEL_NAME", "all-MiniLM-L6-v2")
 EMBEDDINGS_DEVICE = os.getenv("EMBEDDINGS_DEVICE", "cpu")
+EMBEDDINGS_BATCH_SIZE = int(os.getenv("EMBEDDINGS_BATCH_SIZE", "64"))
+
+_model_kwargs: Dict[str, Any] = {"device": EMBEDDINGS_DEVICE}
+if EMBEDDINGS_DEVICE.startswith("cuda"):
+    # Half precision weights run on tensor cores; the vectors are normalized
+    # for cosine search, where fp16 rounding doesn't change the neighbours
+    _model_kwargs["model_kwargs"] = {"torch_dtype": "float16"}
 
 # Initialize HuggingFace embeddings model
 # We enable L2 normalization on the model side — useful for cosine similarity,
 # nearest neighbor search, and pgvector("cosine") indexing.
 _embeddings = HuggingFaceEmbeddings(
     model_name=EMBEDDINGS_MODEL_NAME,
-    model_kwargs={"device": EMBEDDINGS_DEVICE},
-    encode_kwargs={"normalize_embeddings": True},  # ensures unit-length vectors
+    model_kwargs=_model_kwargs,
+    encode_kwargs={
+        "normalize_embeddings": True,  # ensures unit-length vectors
+        "batch_size": EMBEDDINGS_BATCH_SIZE,
+    },
 )
 
 # Our gemma3n model is hosted on Ollama
@@ -52,30 +68,97 @@ llm = ChatOllama(
     temperature=0.5,
 )
 
-language_codes = {
-    "English": "en",
-    "Русский": "ru",
-    "한국어": "ko",
-    "中文": "zh",
-    "日本語": "ja",
-    "Español": "es",
-    "Français": "fr",
-    "Deutsch": "de",
-    "Italiano": "it",
-    "Português": "pt"
-}
-codes_language = {
-    "en":"English",
-    "ru":"Русский",
-    "ko":"한국어",
-    "zh":"中文",
-    "ja":"日本語",
-    "es":"Español",
-    "fr":"Français",
-    "de":"Deutsch",
-    "it":"Italiano",
-    "pt":"Português"
-}
+def _word_lists_schema(title: str, description: str) -> dict:
+    """JSON schema of a word -> list-of-strings object, for structured output."""
+    return {"title": title, "description": description, **WORD_LISTS_ADAPTER.json_schema()}
+
+# Structured-output runnables are built once: with_structured_output converts
+# the schema to a tool/JSON schema and wires an output parser, which is the
+# same for every call. Word -> list payloads come back as plain dicts and are
+# validated with WORD_LISTS_ADAPTER instead of a RootModel.
+_translation_llm = llm.with_structured_output(
+    _word_lists_schema("TranslationResponse", "Maps each lemma to its translations in the target language.")
+)
+_definition_llm = llm.with_structured_output(DefinitionResponse)
+_definitions_batch_llm = llm.with_structured_output(
+    _word_lists_schema("BatchDefinitionResponse", "Maps each word to a list with its definition.")
+)
+_examples_batch_llm = llm.with_structured_output(
+    _word_lists_schema("BatchExamplesResponse", "Maps each word to a list of its example sentences.")
+)
+
+# -----------------------------------------------------------------------------
+# LLM result cache
+# Definitions and examples for the same word repeat across users, so results
+# are memoized in Redis (shared by every worker) for LLM_CACHE_TTL seconds.
+# Definitions are keyed by (language, word); examples additionally by the
+# requested number and the definition they were generated for. Translations
+# are keyed by a digest of the language pair, the text and the word list.
+# Empty results are never stored, so a word the model returned nothing for is
+# retried instead of being pinned for the whole TTL.
+# -----------------------------------------------------------------------------
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 30 * 24 * 3600))  # 30 days
+LLM_LOCAL_CACHE_SIZE = int(os.getenv("LLM_LOCAL_CACHE_SIZE", 4096))
+
+# Per-process tier in front of Redis: hot keys skip the network round trip
+# and JSON decoding. Filled from Redis hits and from new results.
+_local_cache = LRUCache(LLM_LOCAL_CACHE_SIZE)
+
+
+def _definition_key(word: str, language: str) -> str:
+    return f"llm:def:{language}:{word}"
+
+
+def _translation_key(context: str, src_language: str, tgt_language: str, words: List[str]) -> str:
+    digest = hashlib.blake2b(
+        "\x1f".join((src_language, tgt_language, context, *words)).encode(), digest_size=16
+    ).hexdigest()
+    return f"llm:tr:{digest}"
+
+
+def _examples_key(word: str, language: str, examples_number: int, definition: Optional[str]) -> str:
+    definition_hash = hashlib.sha1((definition or "").encode()).hexdigest()
+    return f"llm:ex:{language}:{examples_number}:{word}:{definition_hash}"
+
+
+def _cache_get(keys: List[str]) -> List[Optional[List[str]]]:
+    """
+    Look up cached LLM results, in process first and then in Redis; a
+    missing or unreachable Redis is a miss.
+    """
+    values = [_local_cache.get(key) for key in keys]
+    missing = [i for i, value in enumerate(values) if value is None]
+    if not missing:
+        return values
+    try:
+        fetched = get_redis_client().mget(*(keys[i] for i in missing))
+    except Exception:
+        return values
+    for i, value in zip(missing, fetched):
+        if value is not None:
+            _local_cache.set(keys[i], value)
+            values[i] = value
+    return values
+
+
+def _cache_set(mapping: Dict[str, List[str]]) -> None:
+    """
+    Store non-empty LLM results; caching is best effort and never fails a
+    request.
+
+    Args:
+        mapping: Cache keys and the generated results
+    """
+    mapping = {key: value for key, value in mapping.items() if value}
+    if not mapping:
+        return
+    for key, value in mapping.items():
+        _local_cache.set(key, value)
+    try:
+        get_redis_client().mset(mapping, ex=LLM_CACHE_TTL)
+    except Exception:
+        pass
+
 
 @traceable(name='translations')
 def generate_translation(context: str, src_language: str, tgt_language: str, words: List[str]) -> dict:
@@ -101,24 +184,22 @@ def generate_translation(context: str, src_language: str, tgt_language: str, wor
             }}
 
     """
-    # Create a translation prompt using ChatPromptTemplate
-    prompt = ChatPromptTemplate.from_messages([
-        ('system', "Translate each lemma from {src_language} to {tgt_language}."),
-        ('human', "Words: {words}, Text: {context}")
-    ])
-
-    # Format the prompt with provided variables
-    messages = prompt.format_messages(
-        context=context,
-        src_language=src_language,
-        tgt_language=tgt_language,
-        words=words
-    )
-    structured_llm = llm.with_structured_output(TranslationResponse)
-    # Use the LLM to generate the translation
-    response = structured_llm.invoke(messages)
-    structured_output = TranslationRead(words=response, context=context, src_language=src_language, tgt_language=tgt_language)
-    return structured_output
+    # Repeats of the same text (retries, double submits) are served from
+    # the in-process tier of the LLM cache
+    cache_key = _translation_key(context, src_language, tgt_language, words)
+    response = _cache_get([cache_key])[0]
+    if response is None:
+        # Format the precompiled translation prompt with provided variables
+        messages = TRANSLATION_TMPL.format_messages(
+            context=context,
+            src_language=src_language,
+            tgt_language=tgt_language,
+            words=words
+        )
+        # Use the LLM to generate the translation
+        response = WORD_LISTS_ADAPTER.validate_python(_translation_llm.invoke(messages))
+        _cache_set({cache_key: response})
+    return TranslationRead(words=response, text=context, src_language=src_language, tgt_language=tgt_language)
 
 @traceable(name='definitions')
 def generate_definition(word: str, language: str,  context: Optional[str]=None) -> dict:
@@ -136,21 +217,20 @@ def generate_definition(word: str, language: str,  context: Optional[str]=None)
             "definition": ["single definition"],
         }}
     """
-    # Create a definition prompt using PromptTemplate
-    prompt = ChatPromptTemplate.from_messages([
-        ('system', "Generate a single definition for the word in {language}, based only on its meaning in the given context"),
-        ('human', 'Word: {word}, Context: {context}')
-    ])
-    
-    # Format the prompt with the provided variables
-    messages = prompt.format_messages(
+    key = _definition_key(word, language)
+    cached = _cache_get([key])[0]
+    if cached is not None:
+        return DefinitionRead(definition=cached, word=word, language=language, context=context).model_dump()
+
+    # Format the precompiled definition prompt with the provided variables
+    messages = DEFINITION_TMPL.format_messages(
         language=language,
         word=word,
         context=context
     )
-    structured_llm = llm.with_structured_output(DefinitionResponse)
     # Use the llm to invoke the prompt and get the response
-    response = structured_llm.invoke(messages)
+    response = _definition_llm.invoke(messages)
+    _cache_set({key: response.definition})
     structured_output = DefinitionRead(definition=response.definition, word=word, language=language, context=context)
     return structured_output.model_dump()
 
@@ -170,21 +250,153 @@ def generate_examples(word: str, language: str, examples_number: int = 1, defini
             "examples_number": {examples_number},
         }
     """
-    # Create an example prompt using ChatPromptTemplate
-    prompt = ChatPromptTemplate.from_messages([
-        ('system', "Generate {examples_number} simple sentences for the word in {language}. Look at this definition to understand the meaning of the word."), 
-        ('human', 'Definition: {definition}, Word: {word}')
-    ])
-    # Format the prompt with the provided variables
-    messages = prompt.format_messages(word=word, 
-                            language=language, 
-                            definition=definition, 
-                            examples_number=examples_number)
-    # Use the llm to invoke the prompt and get the response
-    structured_llm = llm.with_structured_output(ExamplesResponse)
-    response = structured_llm.invoke(messages)
+    key = _examples_key(word, language, examples_number, definition)
+    cached = _cache_get([key])[0]
+    if cached is not None:
+        return ExamplesRead(examples=cached, word=word, language=language, examples_number=examples_number, definition=definition)
+
+    # Concurrent requests are coalesced into one batch LLM call, which also
+    # caches the result
+    examples = _examples_batcher.submit((language, ExamplesItem(word, examples_number, definition)))
+
+    return ExamplesRead(examples=examples, word=word, language=language, examples_number=examples_number, definition=definition)
+
+@traceable(name='definitions_batch')
+def generate_definitions_batch(words: Iterable[str], language: str, context: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Generate definitions for several words with a single LLM call.
 
-    return ExamplesRead(examples=response.examples, word=word, language=language, examples_number=examples_number, definition=definition)
+    Args:
+        words (Iterable[str]): The words to define.
+        language (str): The language in which definitions are to be provided.
+        context (str): The original text in which the words are used.
+
+    Returns:
+        dict: A dictionary containing:
+        {{
+            "word1": ["single definition"],
+            "word2": ["single definition"],
+        }}
+    """
+    if not words:
+        return {}
+
+    keys = {word: _definition_key(word, language) for word in words}
+    result = {
+        word: cached
+        for word, cached in zip(keys, _cache_get(list(keys.values())))
+        if cached is not None
+    }
+    missing = [word for word in keys if word not in result]
+    if not missing:
+        return result
+
+    messages = DEFINITIONS_BATCH_TMPL.format_messages(
+        language=language,
+        words=missing,
+        context=context
+    )
+    response = WORD_LISTS_ADAPTER.validate_python(_definitions_batch_llm.invoke(messages))
+    _cache_set(
+        {keys[word]: definitions for word, definitions in response.items() if word in keys}
+    )
+    result.update(response)
+    return result
+
+@traceable(name='examples_batch')
+def generate_examples_batch(items: List[ExamplesItem], language: str) -> Dict[str, List[str]]:
+    """
+    Generate usage examples for several words with a single LLM call.
+
+    Args:
+        items (List[ExamplesItem]): Words with their examples_number and optional definition.
+        language (str): The language in which examples are to be provided.
+
+    Returns:
+        dict: A dictionary containing:
+        {
+            "word1": ["example sentence 1", "example sentence 2", ...],
+            "word2": ["example sentence 1", ...],
+        }
+    """
+    return {
+        item.word: examples
+        for item, examples in zip(items, _generate_examples_items(items, language))
+    }
+
+def _generate_examples_items(items: List[ExamplesItem], language: str) -> List[List[str]]:
+    """
+    Examples for each item, in input order.
+
+    Results are keyed by the full _examples_key, so the same word with a
+    different definition or examples_number gets its own sentences. The LLM
+    answers by word, though, so items sharing a word go to separate calls.
+    """
+    keys = [_examples_key(item.word, language, item.examples_number, item.definition) for item in items]
+    pending = dict(zip(keys, items))
+    result = {
+        key: cached
+        for key, cached in zip(pending, _cache_get(list(pending)))
+        if cached is not None
+    }
+    missing = [(key, item) for key, item in pending.items() if key not in result]
+
+    while missing:
+        call: Dict[str, Tuple[str, ExamplesItem]] = {}
+        deferred = []
+        for key, item in missing:
+            if item.word in call:
+                deferred.append((key, item))
+            else:
+                call[item.word] = (key, item)
+
+        words = "\n".join(
+            f"Word: {item.word}, Number: {item.examples_number}, Definition: {item.definition}"
+            for _, item in call.values()
+        )
+        messages = EXAMPLES_BATCH_TMPL.format_messages(language=language, words=words)
+        response = WORD_LISTS_ADAPTER.validate_python(_examples_batch_llm.invoke(messages))
+        generated = {key: response.get(word, []) for word, (key, _) in call.items()}
+        _cache_set(generated)
+        result.update(generated)
+        missing = deferred
+
+    return [result[key] for key in keys]
+
+def _run_examples_batch(requests: List[Tuple[str, ExamplesItem]]) -> List[List[str]]:
+    """Answer coalesced (language, item) example requests with one batch call per language."""
+    by_language: Dict[str, List[int]] = {}
+    for i, (language, _) in enumerate(requests):
+        by_language.setdefault(language, []).append(i)
+    results: List[List[str]] = [[] for _ in requests]
+    for language, indices in by_language.items():
+        generated = _generate_examples_items([requests[i][1] for i in indices], language)
+        for i, examples in zip(indices, generated):
+            results[i] = examples
+    return results
+
+# Single-word example requests (the /examples endpoint) arriving within
+# EXAMPLES_BATCH_WAIT seconds of each other share one LLM call
+EXAMPLES_BATCH_WAIT = float(os.getenv("EXAMPLES_BATCH_WAIT", 0.005))
+_examples_batcher = MicroBatcher(_run_examples_batch, max_wait=EXAMPLES_BATCH_WAIT)
+
+@traceable(name="embed_batch")
+def embed_batch(texts: List[str]) -> List[List[float]]:
+    """
+    Embed many short texts (e.g. lemmas) in a single model call.
+
+    Unlike `embed`, texts are not split into chunks: each input string
+    yields exactly one L2-normalized vector, in input order.
+
+    Args:
+        texts (List[str]): Texts to embed.
+
+    Returns:
+        List[List[float]]: One embedding per input text.
+    """
+    if not texts:
+        return []
+    return _embeddings.embed_documents(texts)
 
 @traceable(name="embed")
 def embed(text: str, 
@@ -0,0 +1,24 @@
+from langchain_core.prompts import ChatPromptTemplate
+
+# Prompt templates are parsed once at import and reused by every call in
+# src.services.generate; only format_messages runs per request.
+
+TRANSLATION_TMPL = ChatPromptTemplate.from_messages([
+    ('system', "Translate each lemma from {src_language} to {tgt_language}. The text may consist of several passages separated by '---'; use them as context for the lemmas."),
+    ('human', "Words: {words}, Text: {context}")
+])
+
+DEFINITION_TMPL = ChatPromptTemplate.from_messages([
+    ('system', "Generate a single definition for the word in {language}, based only on its meaning in the given context"),
+    ('human', 'Word: {word}, Context: {context}')
+])
+
+DEFINITIONS_BATCH_TMPL = ChatPromptTemplate.from_messages([
+    ('system', "Generate a single definition in {language} for each of the given words, based only on its meaning in the given context. Map every word to a list with its definition."),
+    ('human', 'Words: {words}, Context: {context}')
+])
+
+EXAMPLES_BATCH_TMPL = ChatPromptTemplate.from_messages([
+    ('system', "For each word below generate the requested number of simple sentences in {language}. Look at each definition to understand the meaning of the word. Map every word to a list of its sentences."),
+    ('human', '{words}')
+])
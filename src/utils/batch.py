@@ -0,0 +1,57 @@
+"""
+Request coalescing helpers.
+"""
+
+import time
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Callable, List, Tuple
+
+
+class MicroBatcher:
+    """
+    Merges concurrent single-item calls into one batched call.
+
+    Sync endpoints run in a threadpool, so concurrent requests arrive on
+    different threads. The first caller of a window becomes the leader: it
+    waits `max_wait` seconds for other callers to queue their items, then
+    runs `batch_fn` once for everything queued and hands each caller its own
+    result. Callers just block on `submit` as if they had made the call
+    themselves.
+
+    Args:
+        batch_fn: Takes a list of items, returns a list of results in the same order
+        max_wait: Seconds the leader waits for more items before running the batch
+    """
+    __slots__ = ("batch_fn", "max_wait", "_pending", "_lock")
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], max_wait: float = 0.005):
+        self.batch_fn = batch_fn
+        self.max_wait = max_wait
+        self._pending: List[Tuple[Any, Future]] = []
+        self._lock = Lock()
+
+    def submit(self, item: Any) -> Any:
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((item, future))
+            leader = len(self._pending) == 1
+
+        if leader:
+            time.sleep(self.max_wait)
+            with self._lock:
+                batch, self._pending = self._pending, []
+            try:
+                results = self.batch_fn([queued for queued, _ in batch])
+                if len(results) != len(batch):
+                    raise ValueError(
+                        f"batch_fn returned {len(results)} results for {len(batch)} items"
+                    )
+            except Exception as e:
+                for _, waiter in batch:
+                    waiter.set_exception(e)
+            else:
+                for (_, waiter), result in zip(batch, results):
+                    waiter.set_result(result)
+
+        return future.result()
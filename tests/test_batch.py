@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.batch import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Test coalescing of concurrent calls into batches"""
+
+    def test_single_call(self):
+        batcher = MicroBatcher(lambda items: [item * 2 for item in items], max_wait=0)
+        assert batcher.submit(21) == 42
+
+    def test_concurrent_calls_share_a_batch(self):
+        batches = []
+
+        def batch_fn(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(batch_fn, max_wait=0.05)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(batcher.submit, range(8)))
+
+        assert results == [item * 2 for item in range(8)]
+        assert sum(len(batch) for batch in batches) == 8
+        assert len(batches) < 8
+
+    def test_errors_reach_every_caller(self):
+        def batch_fn(items):
+            raise RuntimeError("model unavailable")
+
+        batcher = MicroBatcher(batch_fn, max_wait=0)
+        with pytest.raises(RuntimeError):
+            batcher.submit("word")
+
+    def test_result_count_mismatch_fails_callers(self):
+        batcher = MicroBatcher(lambda items: [], max_wait=0)
+        with pytest.raises(ValueError):
+            batcher.submit("word")
@@ -0,0 +1,32 @@
+from src.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    """Test the bounded LRU cache"""
+
+    def test_get_missing_returns_default(self):
+        cache = LRUCache(maxsize=2)
+        assert cache.get("key") is None
+        assert cache.get("key", "default") == "default"
+
+    def test_set_then_get(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("key", ["value"])
+        assert cache.get("key") == ["value"]
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_clear(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("key", "value")
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,101 @@
+from itertools import product
+from string import ascii_lowercase
+from types import SimpleNamespace
+
+import src.api.nodes as nodes
+from src.api.nodes import lemmatize_text, _TEXT_SPLITTER, _WORD_RE
+
+
+# Languages without an analyzer use the regex fallback: every alphabetic
+# token, lowercased, tagged "X"
+FALLBACK_LANG = "xx"
+
+
+def _unique_words(n):
+    """Distinct alphabetic words, so each word has exactly one offset"""
+    return ["w" + "".join(letters) for letters in product(ascii_lowercase, repeat=3)][:n]
+
+
+class TestLemmatizeTextChunks:
+    """Test assignment of analyzed words to overlapping chunks"""
+
+    text = " ".join(_unique_words(200))
+
+    def _chunks(self):
+        return [
+            (doc.page_content, doc.metadata["start_index"])
+            for doc in _TEXT_SPLITTER.create_documents([self.text])
+        ]
+
+    def test_text_spans_several_overlapping_chunks(self):
+        chunks = self._chunks()
+        assert len(chunks) > 2
+        assert all(
+            start < prev_start + len(prev)
+            for (prev, prev_start), (_, start) in zip(chunks, chunks[1:])
+        )
+
+    def test_words_land_in_exactly_the_chunks_containing_them(self):
+        result = lemmatize_text(self.text, FALLBACK_LANG)
+
+        expected = {}
+        for chunk, start in self._chunks():
+            for match in _WORD_RE.finditer(self.text):
+                if start <= match.start() < start + len(chunk):
+                    expected.setdefault(chunk, set()).add((match.group(), "X", FALLBACK_LANG))
+
+        assert result == expected
+
+    def test_overlap_first_and_last_chunks(self):
+        result = lemmatize_text(self.text, FALLBACK_LANG)
+        chunks = self._chunks()
+        words = self.text.split()
+
+        assert (words[0], "X", FALLBACK_LANG) in result[chunks[0][0]]
+        assert (words[-1], "X", FALLBACK_LANG) in result[chunks[-1][0]]
+
+        # Words in the overlaps are assigned to every chunk they appear in
+        counts = {}
+        for chunk_words in result.values():
+            for word in chunk_words:
+                counts[word] = counts.get(word, 0) + 1
+        assert len(counts) == len(words)
+        assert any(count > 1 for count in counts.values())
+
+    def test_empty_text(self):
+        assert lemmatize_text("", FALLBACK_LANG) == {}
+
+
+class _FixedSplitter:
+    """Stands in for the text splitter, returning preset (chunk, start_index) pairs"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def create_documents(self, texts):
+        return [
+            SimpleNamespace(page_content=chunk, metadata={"start_index": start})
+            for chunk, start in self.chunks
+        ]
+
+
+class TestLemmatizeTextUnlocatedChunks:
+    """Test chunks the splitter reports with start_index -1"""
+
+    text = "alpha beta gamma delta"
+
+    def test_unlocated_chunks_are_found_again_or_dropped(self, monkeypatch):
+        monkeypatch.setattr(nodes, "_TEXT_SPLITTER", _FixedSplitter([
+            ("alpha beta", 0),
+            ("beta gamma", -1),
+            ("delta", -1),
+            ("missing", -1),
+        ]))
+
+        result = lemmatize_text(self.text, FALLBACK_LANG)
+
+        assert result == {
+            "alpha beta": {("alpha", "X", FALLBACK_LANG), ("beta", "X", FALLBACK_LANG)},
+            "beta gamma": {("beta", "X", FALLBACK_LANG), ("gamma", "X", FALLBACK_LANG)},
+            "delta": {("delta", "X", FALLBACK_LANG)},
+        }
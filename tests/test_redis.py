@@ -8,9 +8,18 @@ Run this script to test Redis connection and basic operations.
 
 import os
 import sys
-import json
+import orjson
 from datetime import datetime
 
+# Set REDIS_TEST_VERBOSE=1 to print retrieved values in full
+VERBOSE = os.getenv("REDIS_TEST_VERBOSE") == "1"
+
+def _preview(data) -> str:
+    """Pretty-print data when verbose, otherwise just its size."""
+    if VERBOSE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return f"{len(data)} items"
+
 # Add the src directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
@@ -40,7 +49,7 @@ def test_basic_operations():
         
         retrieved_data = redis.get("test:basic")
         print(f"   Get operation: {'✅ Success' if retrieved_data == test_data else '❌ Failed'}")
-        print(f"   Retrieved data: {json.dumps(retrieved_data, indent=2)}")
+        print(f"   Retrieved data: {_preview(retrieved_data)}")
         
         # Test 2: Hash operations
         print("\n2. Testing Hash operations...")
@@ -55,7 +64,7 @@ def test_basic_operations():
         print(f"   Hash set: {fields_set} fields set")
         
         retrieved_hash = redis.hgetall("user:12345")
-        print(f"   Hash get all: {json.dumps(retrieved_hash, indent=2)}")
+        print(f"   Hash get all: {_preview(retrieved_hash)}")
         
         # Test 3: List operations
         print("\n3. Testing List operations...")
@@ -65,7 +74,7 @@ def test_basic_operations():
         print(f"   List push: {pushed_count} items pushed")
         
         list_data = redis.lrange("test:list", 0, -1)
-        print(f"   List range: {json.dumps(list_data, indent=2)}")
+        print(f"   List range: {_preview(list_data)}")
         
         # Test 4: Set operations
         print("\n4. Testing Set operations...")
@@ -77,21 +86,34 @@ def test_basic_operations():
         set_data = redis.smembers("test:set")
         print(f"   Set members: {list(set_data)}")
         
-        # Test 5: Existence and TTL
-        print("\n5. Testing Existence and TTL...")
+        # Test 5: Multi-key operations
+        print("\n5. Testing Multi-key operations...")
+        multi_data = {"test:multi:1": ["a", "b"], "test:multi:2": ["c"]}
+        
+        success = redis.mset(multi_data, ex=300)
+        print(f"   Multi set: {'✅ Success' if success else '❌ Failed'}")
+        
+        multi_values = redis.mget("test:multi:1", "test:multi:2", "test:multi:missing")
+        print(f"   Multi get: {'✅ Success' if multi_values == [['a', 'b'], ['c'], None] else '❌ Failed'}")
+        redis.delete("test:multi:1", "test:multi:2")
+        
+        # Test 6: Existence and TTL
+        print("\n6. Testing Existence and TTL...")
         exists = redis.exists("test:basic")
         print(f"   Key exists: {exists > 0}")
         
         ttl = redis.ttl("test:basic")
         print(f"   TTL: {ttl} seconds")
         
-        # Test 6: Delete operations
-        print("\n6. Testing Delete operations...")
-        deleted_count = redis.delete("test:basic", "user:12345", "test:list", "test:set")
+        # Test 7: Delete operations
+        print("\n7. Testing Delete operations...")
+        # UNLINK and the verifying EXISTS go out in one round trip
+        keys = ("test:basic", "user:12345", "test:list", "test:set")
+        pipe = redis.redis.pipeline(transaction=False)
+        pipe.unlink(*keys)
+        pipe.exists(*keys)
+        deleted_count, exists_after = pipe.execute()
         print(f"   Deleted {deleted_count} keys")
-        
-        # Verify deletion
-        exists_after = redis.exists("test:basic", "user:12345", "test:list", "test:set")
         print(f"   Keys exist after deletion: {exists_after}")
         
         print("\n✅ All basic operations completed successfully!")
@@ -190,18 +212,20 @@ def test_performance():
         print("\n1. Bulk Set Operations...")
         import time
         
-        start_time = time.time()
+        # One timestamp for the whole batch, taken outside the timed loop
+        timestamp = datetime.now().isoformat()
+        start_ns = time.perf_counter_ns()
         for i in range(100):
             key = f"bulk:test:{i}"
-            value = {"index": i, "data": f"value_{i}", "timestamp": datetime.now().isoformat()}
+            value = {"index": i, "data": f"value_{i}", "timestamp": timestamp}
             redis.set(key, value, ex=60)
         
-        set_time = time.time() - start_time
-        print(f"   Set 100 keys in {set_time:.3f} seconds")
+        set_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        print(f"   Set 100 keys in {set_ms:.3f} ms")
         
         # Bulk get operations
         print("\n2. Bulk Get Operations...")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         retrieved_count = 0
         for i in range(100):
             key = f"bulk:test:{i}"
@@ -209,12 +233,12 @@ def test_performance():
             if value:
                 retrieved_count += 1
         
-        get_time = time.time() - start_time
-        print(f"   Retrieved {retrieved_count}/100 keys in {get_time:.3f} seconds")
+        get_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        print(f"   Retrieved {retrieved_count}/100 keys in {get_ms:.3f} ms")
         
         # Clean up
         keys_to_delete = [f"bulk:test:{i}" for i in range(100)]
-        deleted_count = redis.delete(*keys_to_delete)
+        deleted_count = redis.unlink(*keys_to_delete)
         print(f"   Cleaned up {deleted_count} keys")
         
         print("\n✅ Performance test completed!")
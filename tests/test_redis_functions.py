@@ -8,6 +8,7 @@ This script tests the Redis functions to ensure they work correctly.
 import sys
 import os
 import time
+import orjson
 from typing import Dict, Any
 
 # Add the project root to the Python path
@@ -22,6 +23,9 @@ from src.core.redis_functions import (
     set_expiration,
     get_ttl,
     
+    # Pipelined operations
+    pipeline_exec,
+    
     # Hash operations
     set_hash_data,
     get_hash_data,
@@ -37,6 +41,7 @@ from src.core.redis_functions import (
     get_set_data,
     remove_from_set,
     is_set_member,
+    are_set_members,
     
     # Utility functions
     redis_health_check,
@@ -199,6 +204,10 @@ def test_set_operations():
     assert not result["is_member"], f"JavaScript should not be a member: {result}"
     print("✅ Check membership (not exists)")
     
+    result = are_set_members(test_set, "python", "javascript")
+    assert result["members"] == {"python": True, "javascript": False}, f"Membership mismatch: {result}"
+    print("✅ Check several members at once")
+    
     # Remove from set
     result = remove_from_set(test_set, ["redis"])
     assert result["success"], f"Failed to remove from set: {result}"
@@ -212,6 +221,24 @@ def test_set_operations():
     print("✅ Verify updated set")
 
 
+def test_pipeline_exec():
+    """Test pipelined Redis commands."""
+    print("\n🧪 Testing Pipelined Operations...")
+    
+    test_key = "test:pipeline:key"
+    result = pipeline_exec([
+        ("set", (test_key, {"name": "Test User"}, 60)),
+        ("get", (test_key,)),
+        ("exists", (test_key, "test:pipeline:missing")),
+        ("delete", (test_key,)),
+    ])
+    assert result["success"], f"Pipeline failed: {result}"
+    set_reply, get_reply, exists_reply, delete_reply = result["results"]
+    assert [set_reply, exists_reply, delete_reply] == [True, 1, 1], f"Unexpected replies: {result}"
+    assert orjson.loads(get_reply) == {"name": "Test User"}, f"Unexpected value: {get_reply}"
+    print("✅ Pipeline set/get/exists/delete")
+
+
 def test_utility_functions():
     """Test utility functions."""
     print("\n🧪 Testing Utility Functions...")
@@ -287,6 +314,7 @@ def main():
         test_hash_operations()
         test_list_operations()
         test_set_operations()
+        test_pipeline_exec()
         test_utility_functions()
         test_error_handling()
         